@@ -1,111 +1,967 @@
 import asyncio
+import pickle
 import time
-import unittest
+from contextlib import ExitStack
 from decimal import Decimal
-from typing import Awaitable
-from unittest.mock import AsyncMock, MagicMock, patch
+from functools import partial
+from operator import attrgetter
+from test.isolated_asyncio_wrapper_test_case import LocalClassEventLoopWrapperTestCase
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Tuple
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from xrpl.asyncio.clients import XRPLRequestFailureException
-from xrpl.models import OfferCancel, Request, Response, Transaction
-from xrpl.models.requests.request import RequestMethod
-from xrpl.models.response import ResponseStatus, ResponseType
+from xrpl.models.requests.request import Request, RequestMethod
+from xrpl.models.response import Response, ResponseStatus, ResponseType
+from xrpl.models.transactions import OfferCancel, Transaction
 from xrpl.models.transactions.types import TransactionType
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS
 from hummingbot.connector.exchange.xrpl.xrpl_api_order_book_data_source import XRPLAPIOrderBookDataSource
-from hummingbot.connector.exchange.xrpl.xrpl_api_user_stream_data_source import XRPLAPIUserStreamDataSource
 from hummingbot.connector.exchange.xrpl.xrpl_auth import XRPLAuth
 from hummingbot.connector.exchange.xrpl.xrpl_exchange import XrplExchange
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
-from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
+from hummingbot.core.utils.async_utils import safe_ensure_future
 
+_SOLO_CURRENCY = "534F4C4F00000000000000000000000000000000"  # noqa: mock
+_SOLO_ISSUER = "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz"  # noqa: mock
+_USDC_CURRENCY = "5553444300000000000000000000000000000000"  # noqa: mock
+_SOLO_AMOUNT = {"currency": _SOLO_CURRENCY, "issuer": _SOLO_ISSUER}
 
-class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
+
+def _make_async_cm_mock() -> AsyncMock:
+    client = AsyncMock()
+    client.__aenter__.return_value = client
+    client.__aexit__.return_value = None
+    return client
+
+
+def _make_async_return(value: Any) -> Callable[..., Awaitable[Any]]:
+    async def _return(*args, **kwargs):
+        return value
+
+    return _return
+
+
+def _noop(*args, **kwargs) -> None:
+    return None
+
+
+_async_noop = _make_async_return(None)
+
+
+def _respond_by_method(responses: Dict[RequestMethod, Response]) -> Callable[[Request], Response]:
+    def _respond(request: Request) -> Response:
+        if request.method not in responses:
+            raise ValueError("Invalid method")
+        return responses[request.method]
+
+    return _respond
+
+
+def _stub_transaction(tx_hash: str = "hash", last_ledger_sequence: int = 12345) -> SimpleNamespace:
+    return SimpleNamespace(get_hash=lambda: tx_hash, last_ledger_sequence=last_ledger_sequence)
+
+
+class _TrackerStub:
+    __slots__ = ("all_fillable_orders",)
+
+    def __init__(self, all_fillable_orders: Dict[str, InFlightOrder]):
+        self.all_fillable_orders = all_fillable_orders
+
+
+class _AsyncIter:
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Iterable[Any]):
+        self._items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+_D_1 = Decimal(1)
+_D_1E_6 = Decimal("1e-6")
+_D_1E_8 = Decimal("1e-8")
+_D_1E_15 = Decimal("1e-15")
+_BIG_AMOUNT = Decimal("12345.12345678901234567")
+_BIG_PRICE = Decimal("1234567.123456789")
+_ORDER_AMOUNT = Decimal("1.47951609")
+_ORDER_PRICE = Decimal("0.224547537")
+_FILLED_ORDER_PRICE = Decimal("0.222451")
+_FILLED_ORDER_AMOUNT = Decimal("5.619196007179491")
+
+_TRADING_RULE_SOLO_XRP = TradingRule(
+    trading_pair="SOLO-XRP",
+    min_order_size=_D_1E_6,
+    min_price_increment=_D_1E_6,
+    min_quote_amount_increment=_D_1E_6,
+    min_base_amount_increment=_D_1E_15,
+    min_notional_size=_D_1E_6,
+)
+
+_TRADING_RULE_SOLO_USD = TradingRule(
+    trading_pair="SOLO-USD",
+    min_order_size=_D_1E_6,
+    min_price_increment=_D_1E_6,
+    min_quote_amount_increment=_D_1E_6,
+    min_base_amount_increment=_D_1E_6,
+    min_notional_size=_D_1E_6,
+)
+
+# TradingRule has no __eq__, so rules are compared through the limits they carry
+_trading_rule_limits = attrgetter(
+    "min_order_size",
+    "min_price_increment",
+    "min_quote_amount_increment",
+    "min_base_amount_increment",
+    "min_notional_size",
+)
+# The exchange reports the minimum order size as a float, and the connector passes it straight to Decimal
+_EXPECTED_TRADING_RULE_XRP_USD = TradingRule(
+    trading_pair="XRP-USD",
+    min_order_size=Decimal(0.01),
+    min_price_increment=_D_1E_8,
+    min_quote_amount_increment=_D_1E_8,
+    min_base_amount_increment=_D_1E_8,
+    min_notional_size=_D_1E_8,
+)
+_EXPECTED_FEE_RULES_XRP_USD = [
+    {
+        "trading_pair": "XRP-USD",
+        "base_token": "XRP",
+        "quote_token": "USD",
+        "base_transfer_rate": 0.01,
+        "quote_transfer_rate": 0.01,
+    }
+]
+
+_ORDER_SUBMISSION_TARGETS = (
+    "hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient",
+    "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill",
+    "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign",
+    "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_submit",
+)
+
+_SIGNED_OFFER_CREATE = Transaction(
+    sequence=1, last_ledger_sequence=1, account="r1234", transaction_type=TransactionType.OFFER_CREATE
+)
+_UNSIGNED_ACCOUNT_SET = Transaction(account="r1234", transaction_type=TransactionType.ACCOUNT_SET)
+_SUBMIT_SUCCESS_RESPONSE = Response(
+    status=ResponseStatus.SUCCESS, result={"engine_result": "tesSUCCESS", "engine_result_message": "something"}
+)
+_SUBMIT_ERROR_RESPONSE = Response(
+    status=ResponseStatus.ERROR, result={"engine_result": "tec", "engine_result_message": "something"}
+)
+_VALIDATED_NO_CHANGES_RESPONSE = Response(
+    status=ResponseStatus.SUCCESS,
+    result={"engine_result": "tesSUCCESS", "engine_result_message": "something", "meta": {"AffectedNodes": []}},
+)
+_EMPTY_SUCCESS_RESPONSE = Response(status=ResponseStatus.SUCCESS, result={})
+
+_SNAPSHOT_TEMPLATE = {
+    "asks": [
+        {
+            "Account": "r9aZRryD8AZzGqQjYrQQuBBzebjF555Xsa",  # noqa: mock
+            "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07FA0FAB195976",  # noqa: mock
+            "BookNode": "0",
+            "Flags": 131072,
+            "LedgerEntryType": "Offer",
+            "OwnerNode": "0",
+            "PreviousTxnID": "373EA7376A1F9DC150CCD534AC0EF8544CE889F1850EFF0084B46997DAF4F1DA",  # noqa: mock
+            "PreviousTxnLgrSeq": 88935730,
+            "Sequence": 86514258,
+            "TakerGets": {**_SOLO_AMOUNT, "value": "91.846106"},
+            "TakerPays": "20621931",
+            "index": "1395ACFB20A47DE6845CF5DB63CF2E3F43E335D6107D79E581F3398FF1B6D612",  # noqa: mock
+            "owner_funds": "140943.4119268388",
+            "quality": "224527.003899327",
+        },
+        {
+            "Account": "rhqTdSsJAaEReRsR27YzddqyGoWTNMhEvC",  # noqa: mock
+            "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07FA8ECFD95726",  # noqa: mock
+            "BookNode": "0",
+            "Flags": 0,
+            "LedgerEntryType": "Offer",
+            "OwnerNode": "2",
+            "PreviousTxnID": "2C266D54DDFAED7332E5E6EC68BF08CC37CE2B526FB3CFD8225B667C4C1727E1",  # noqa: mock
+            "PreviousTxnLgrSeq": 88935726,
+            "Sequence": 71762354,
+            "TakerGets": {**_SOLO_AMOUNT, "value": "44.527243023"},
+            "TakerPays": "10000000",
+            "index": "186D33545697D90A5F18C1541F2228A629435FC540D473574B3B75FEA7B4B88B",  # noqa: mock
+            "owner_funds": "88.4155435721498",
+            "quality": "224581.6116401958",
+        },
+    ],
+    "bids": [
+        {
+            "Account": "rn3uVsXJL7KRTa7JF3jXXGzEs3A2UEfett",  # noqa: mock
+            "BookDirectory": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F0FE48CEADD8471",  # noqa: mock
+            "BookNode": "0",
+            "Flags": 0,
+            "LedgerEntryType": "Offer",
+            "OwnerNode": "0",
+            "PreviousTxnID": "2030FB97569D955921659B150A2F5F02CC9BBFCA95BAC6B8D55D141B0ABFA945",  # noqa: mock
+            "PreviousTxnLgrSeq": 88935721,
+            "Sequence": 74073461,
+            "TakerGets": "187000000",
+            "TakerPays": {**_SOLO_AMOUNT, "value": "836.5292665312212"},
+            "index": "3F41585F327EA3690AD19F2A302C5DF2904E01D39C9499B303DB7FA85868B69F",  # noqa: mock
+            "owner_funds": "6713077567",
+            "quality": "0.000004473418537600113",
+        },
+        {
+            "Account": "rsoLoDTcxn9wCEHHBR7enMhzQMThkB2w28",  # noqa: mock
+            "BookDirectory": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F0FE48D021C71F2",  # noqa: mock
+            "BookNode": "0",
+            "Expiration": 772644742,
+            "Flags": 0,
+            "LedgerEntryType": "Offer",
+            "OwnerNode": "0",
+            "PreviousTxnID": "226434A5399E210F82F487E8710AE21FFC19FE86FC38F3634CF328FA115E9574",  # noqa: mock
+            "PreviousTxnLgrSeq": 88935719,
+            "Sequence": 69870875,
+            "TakerGets": "90000000",
+            "TakerPays": {**_SOLO_AMOUNT, "value": "402.6077034840102"},
+            "index": "4D31D069F1E2B0F2016DA0F1BF232411CB1B4642A49538CD6BB989F353D52411",  # noqa: mock
+            "owner_funds": "827169016",
+            "quality": "0.000004473418927600114",
+        },
+    ],
+    "trading_pair": "SOLO-XRP",
+}
+
+_EVENT_MESSAGE_TEMPLATE = {
+    "transaction": {
+        "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+        "Fee": "10",
+        "Flags": 786432,
+        "LastLedgerSequence": 88954510,
+        "Memos": [
+            {
+                "Memo": {
+                    "MemoData": "68626F742D313731393430303738313137303331392D42534F585036316263393330633963366139393139386462343432343461383637313231373562313663"  # noqa: mock
+                }
+            }
+        ],
+        "Sequence": 84437780,
+        "SigningPubKey": "ED23BA20D57103E05BA762F0A04FE50878C11BD36B7BF9ADACC3EDBD9E6D320923",  # noqa: mock
+        "TakerGets": "502953",
+        "TakerPays": {**_SOLO_AMOUNT, "value": "2.239836701211152"},
+        "TransactionType": "OfferCreate",
+        "TxnSignature": "2E87E743DE37738DCF1EE6C28F299C4FF18BDCB064A07E9068F1E920F8ACA6C62766177E82917ED0995635E636E3BB8B4E2F4DDCB198B0B9185041BEB466FD03",  # noqa: mock
+        "hash": "undefined",
+        "ctid": "C54D567C00030000",  # noqa: mock
+        "meta": "undefined",
+        "validated": "undefined",
+        "date": 772789130,
+        "ledger_index": "undefined",
+        "inLedger": "undefined",
+        "metaData": "undefined",
+        "status": "undefined",
+    },
+    "meta": {
+        "AffectedNodes": [
+            {
+                "ModifiedNode": {
+                    "FinalFields": {
+                        "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+                        "Balance": "56148988",
+                        "Flags": 0,
+                        "OwnerCount": 3,
+                        "Sequence": 84437781,
+                    },
+                    "LedgerEntryType": "AccountRoot",
+                    "LedgerIndex": "2B3020738E7A44FBDE454935A38D77F12DC5A11E0FA6DAE2D9FCF4719FFAA3BC",  # noqa: mock
+                    "PreviousFields": {"Balance": "56651951", "Sequence": 84437780},
+                    "PreviousTxnID": "BCBB6593A916EDBCC84400948B0525BE7E972B893111FE1C89A7519F8A5ACB2B",  # noqa: mock
+                    "PreviousTxnLgrSeq": 88954461,
+                }
+            },
+            {
+                "ModifiedNode": {
+                    "FinalFields": {
+                        "Account": "rhqTdSsJAaEReRsR27YzddqyGoWTNMhEvC",  # noqa: mock
+                        "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07F01A195F8476",  # noqa: mock
+                        "BookNode": "0",
+                        "Flags": 0,
+                        "OwnerNode": "2",
+                        "Sequence": 71762948,
+                        "TakerGets": {**_SOLO_AMOUNT, "value": "42.50531785780174"},
+                        "TakerPays": "9497047",
+                    },
+                    "LedgerEntryType": "Offer",
+                    "LedgerIndex": "3ABFC9B192B73ECE8FB6E2C46E49B57D4FBC4DE8806B79D913C877C44E73549E",  # noqa: mock
+                    "PreviousFields": {
+                        "TakerGets": {**_SOLO_AMOUNT, "value": "44.756352009"},
+                        "TakerPays": "10000000",
+                    },
+                    "PreviousTxnID": "7398CE2FDA7FF61B52C1039A219D797E526ACCCFEC4C44A9D920ED28B551B539",  # noqa: mock
+                    "PreviousTxnLgrSeq": 88954480,
+                }
+            },
+            {
+                "ModifiedNode": {
+                    "FinalFields": {
+                        "Account": "rhqTdSsJAaEReRsR27YzddqyGoWTNMhEvC",  # noqa: mock
+                        "Balance": "251504663",
+                        "Flags": 0,
+                        "OwnerCount": 30,
+                        "Sequence": 71762949,
+                    },
+                    "LedgerEntryType": "AccountRoot",
+                    "LedgerIndex": "4F7BC1BE763E253402D0CA5E58E7003D326BEA2FEB5C0FEE228660F795466F6E",  # noqa: mock
+                    "PreviousFields": {"Balance": "251001710"},
+                    "PreviousTxnID": "7398CE2FDA7FF61B52C1039A219D797E526ACCCFEC4C44A9D920ED28B551B539",  # noqa: mock
+                    "PreviousTxnLgrSeq": 88954480,
+                }
+            },
+            {
+                "ModifiedNode": {
+                    "FinalFields": {
+                        "Balance": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
+                            "value": "-195.4313653751863",
+                        },
+                        "Flags": 2228224,
+                        "HighLimit": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "rhqTdSsJAaEReRsR27YzddqyGoWTNMhEvC",  # noqa: mock
+                            "value": "399134226.5095641",
+                        },
+                        "HighNode": "0",
+                        "LowLimit": {**_SOLO_AMOUNT, "value": "0"},
+                        "LowNode": "36a5",
+                    },
+                    "LedgerEntryType": "RippleState",
+                    "LedgerIndex": "9DB660A1BF3B982E5A8F4BE0BD4684FEFEBE575741928E67E4EA1DAEA02CA5A6",  # noqa: mock
+                    "PreviousFields": {
+                        "Balance": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
+                            "value": "-197.6826246297997",
+                        }
+                    },
+                    "PreviousTxnID": "BCBB6593A916EDBCC84400948B0525BE7E972B893111FE1C89A7519F8A5ACB2B",  # noqa: mock
+                    "PreviousTxnLgrSeq": 88954461,
+                }
+            },
+            {
+                "ModifiedNode": {
+                    "FinalFields": {
+                        "Balance": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
+                            "value": "45.47502732568766",
+                        },
+                        "Flags": 1114112,
+                        "HighLimit": {**_SOLO_AMOUNT, "value": "0"},
+                        "HighNode": "3799",
+                        "LowLimit": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+                            "value": "1000000000",
+                        },
+                        "LowNode": "0",
+                    },
+                    "LedgerEntryType": "RippleState",
+                    "LedgerIndex": "E1C84325F137AD05CB78F59968054BCBFD43CB4E70F7591B6C3C1D1C7E44C6FC",  # noqa: mock
+                    "PreviousFields": {
+                        "Balance": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
+                            "value": "43.2239931744894",
+                        }
+                    },
+                    "PreviousTxnID": "BCBB6593A916EDBCC84400948B0525BE7E972B893111FE1C89A7519F8A5ACB2B",  # noqa: mock
+                    "PreviousTxnLgrSeq": 88954461,
+                }
+            },
+        ],
+        "TransactionIndex": 3,
+        "TransactionResult": "tesSUCCESS",
+    },
+    "hash": "86440061A351FF77F21A24ED045EE958F6256697F2628C3555AEBF29A887518C",  # noqa: mock
+    "ledger_index": 88954492,
+    "date": 772789130,
+}
+
+_EVENT_LIMIT_PARTIAL_TEMPLATE = {
+    "transaction": {
+        "Account": "rapido5rxPmP4YkMZZEeXSHqWefxHEkqv6",  # noqa: mock
+        "Fee": "10",
+        "Flags": 655360,
+        "LastLedgerSequence": 88981161,
+        "Memos": [
+            {
+                "Memo": {
+                    "MemoData": "06574D47B3D98F0D1103815555734BF30D72EC4805086B873FCCD69082FE00903FF7AC1910CF172A3FD5554FBDAD75193FF00068DB8BAC71"  # noqa: mock
+                }
+            }
+        ],
+        "Sequence": 2368849,
+        "SigningPubKey": "EDE30BA017ED458B9B372295863B042C2BA8F11AD53B4BDFB398E778CB7679146B",  # noqa: mock
+        "TakerGets": {**_SOLO_AMOUNT, "value": "1.479368155160602"},
+        "TakerPays": "333",
+        "TransactionType": "OfferCreate",
+        "TxnSignature": "1165D0B39A5C3C48B65FD20DDF1C0AF544B1413C8B35E6147026F521A8468FB7F8AA3EAA33582A9D8DC9B56E1ED59F6945781118EC4DEC92FF639C3D41C3B402",  # noqa: mock
+        "hash": "undefined",
+        "ctid": "C54DBEA8001D0000",  # noqa: mock
+        "meta": "undefined",
+        "validated": "undefined",
+        "date": 772789130,
+        "ledger_index": "undefined",
+        "inLedger": "undefined",
+        "metaData": "undefined",
+        "status": "undefined",
+    },
+    "meta": {
+        "AffectedNodes": [
+            {
+                "ModifiedNode": {
+                    "FinalFields": {
+                        "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+                        "Balance": "57030924",
+                        "Flags": 0,
+                        "OwnerCount": 9,
+                        "Sequence": 84437901,
+                    },
+                    "LedgerEntryType": "AccountRoot",
+                    "LedgerIndex": "2B3020738E7A44FBDE454935A38D77F12DC5A11E0FA6DAE2D9FCF4719FFAA3BC",  # noqa: mock
+                    "PreviousFields": {"Balance": "57364223"},
+                    "PreviousTxnID": "1D63D9DFACB8F25ADAF44A1976FBEAF875EF199DEA6F9502B1C6C32ABA8583F6",  # noqa: mock
+                    "PreviousTxnLgrSeq": 88981158,
+                }
+            },
+            {
+                "ModifiedNode": {
+                    "FinalFields": {
+                        "Account": "rapido5rxPmP4YkMZZEeXSHqWefxHEkqv6",  # noqa: mock
+                        "AccountTxnID": "602B32630738581F2618849B3338401D381139F8458DDF2D0AC9B61BEED99D70",  # noqa: mock
+                        "Balance": "4802538039",
+                        "Flags": 0,
+                        "OwnerCount": 229,
+                        "Sequence": 2368850,
+                    },
+                    "LedgerEntryType": "AccountRoot",
+                    "LedgerIndex": "BFF40FB02870A44349BB5E482CD2A4AA3415C7E72F4D2E9E98129972F26DA9AA",  # noqa: mock
+                    "PreviousFields": {
+                        "AccountTxnID": "43B7820240604D3AFE46079D91D557259091DDAC17D42CD7688637D58C3B7927",  # noqa: mock
+                        "Balance": "4802204750",
+                        "Sequence": 2368849,
+                    },
+                    "PreviousTxnID": "43B7820240604D3AFE46079D91D557259091DDAC17D42CD7688637D58C3B7927",  # noqa: mock
+                    "PreviousTxnLgrSeq": 88981160,
+                }
+            },
+            {
+                "ModifiedNode": {
+                    "FinalFields": {
+                        "Balance": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
+                            "value": "41.49115329259071",
+                        },
+                        "Flags": 1114112,
+                        "HighLimit": {**_SOLO_AMOUNT, "value": "0"},
+                        "HighNode": "3799",
+                        "LowLimit": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+                            "value": "1000000000",
+                        },
+                        "LowNode": "0",
+                    },
+                    "LedgerEntryType": "RippleState",
+                    "LedgerIndex": "E1C84325F137AD05CB78F59968054BCBFD43CB4E70F7591B6C3C1D1C7E44C6FC",  # noqa: mock
+                    "PreviousFields": {
+                        "Balance": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
+                            "value": "40.01178513743011",
+                        }
+                    },
+                    "PreviousTxnID": "EA21F8D1CD22FA64C98CB775855F53C186BF0AD24D59728AA8D18340DDAA3C57",  # noqa: mock
+                    "PreviousTxnLgrSeq": 88981118,
+                }
+            },
+            {
+                "ModifiedNode": {
+                    "FinalFields": {
+                        "Balance": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
+                            "value": "-5.28497026524528",
+                        },
+                        "Flags": 2228224,
+                        "HighLimit": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "rapido5rxPmP4YkMZZEeXSHqWefxHEkqv6",  # noqa: mock
+                            "value": "0",
+                        },
+                        "HighNode": "18",
+                        "LowLimit": {**_SOLO_AMOUNT, "value": "0"},
+                        "LowNode": "387f",
+                    },
+                    "LedgerEntryType": "RippleState",
+                    "LedgerIndex": "E56AB275B511ECDF6E9C9D8BE9404F3FECBE5C841770584036FF8A832AF3F3B9",  # noqa: mock
+                    "PreviousFields": {
+                        "Balance": {
+                            "currency": _SOLO_CURRENCY,
+                            "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
+                            "value": "-6.764486357221399",
+                        }
+                    },
+                    "PreviousTxnID": "43B7820240604D3AFE46079D91D557259091DDAC17D42CD7688637D58C3B7927",  # noqa: mock
+                    "PreviousTxnLgrSeq": 88981160,
+                }
+            },
+            {
+                "ModifiedNode": {
+                    "FinalFields": {
+                        "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+                        "BookDirectory": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F0FC4DA2F8AAF5B",  # noqa: mock
+                        "BookNode": "0",
+                        "Flags": 131072,
+                        "OwnerNode": "0",
+                        "Sequence": 84437895,
+                        "TakerGets": "33",
+                        "TakerPays": {**_SOLO_AMOUNT, "value": "0.000147936815515"},
+                    },
+                    "LedgerEntryType": "Offer",
+                    "LedgerIndex": "F91EFE46023BA559CEF49B670052F19189C8B6422A93FA26D35F2D6A25290D24",  # noqa: mock
+                    "PreviousFields": {
+                        "TakerGets": "333332",
+                        "TakerPays": {**_SOLO_AMOUNT, "value": "1.479516091976118"},
+                    },
+                    "PreviousTxnID": "12A2F4A0FAA21802E68F4BF78BCA3DE302222B0B9FB938C355EE10E931C151D2",  # noqa: mock
+                    "PreviousTxnLgrSeq": 88981157,
+                }
+            },
+        ],
+        "TransactionIndex": 29,
+        "TransactionResult": "tesSUCCESS",
+    },
+    "hash": "602B32630738581F2618849B3338401D381139F8458DDF2D0AC9B61BEED99D70",  # noqa: mock
+    "ledger_index": 88981160,
+    "date": 772789130,
+}
+
+# The user stream listener modifies the event payloads in place, so every test unpickles its own copy
+_SNAPSHOT_PICKLE = pickle.dumps(_SNAPSHOT_TEMPLATE, protocol=pickle.HIGHEST_PROTOCOL)
+_EVENT_MESSAGE_PICKLE = pickle.dumps(_EVENT_MESSAGE_TEMPLATE, protocol=pickle.HIGHEST_PROTOCOL)
+_EVENT_LIMIT_PARTIAL_PICKLE = pickle.dumps(_EVENT_LIMIT_PARTIAL_TEMPLATE, protocol=pickle.HIGHEST_PROTOCOL)
+
+_ACCOUNT_INFO_RESULT = {
+    "account_data": {
+        "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+        "Balance": "57030864",
+        "Flags": 0,
+        "LedgerEntryType": "AccountRoot",
+        "OwnerCount": 3,
+        "PreviousTxnID": "0E8031892E910EB8F19537610C36E5816D5BABF14C91CF8C73FFE5F5D6A0623E",  # noqa: mock
+        "PreviousTxnLgrSeq": 88981167,
+        "Sequence": 84437907,
+        "index": "2B3020738E7A44FBDE454935A38D77F12DC5A11E0FA6DAE2D9FCF4719FFAA3BC",  # noqa: mock
+    },
+    "account_flags": {
+        "allowTrustLineClawback": False,
+        "defaultRipple": False,
+        "depositAuth": False,
+        "disableMasterKey": False,
+        "disallowIncomingCheck": False,
+        "disallowIncomingNFTokenOffer": False,
+        "disallowIncomingPayChan": False,
+        "disallowIncomingTrustline": False,
+        "disallowIncomingXRP": False,
+        "globalFreeze": False,
+        "noFreeze": False,
+        "passwordSpent": False,
+        "requireAuthorization": False,
+        "requireDestinationTag": False,
+    },
+    "ledger_hash": "DFDFA9B7226B8AC1FD909BB9C2EEBDBADF4C37E2C3E283DB02C648B2DC90318C",  # noqa: mock
+    "ledger_index": 89003974,
+    "validated": True,
+}
+
+_ACCOUNT_LINES_RESULT = {
+    "account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+    "ledger_hash": "6626B7AC7E184B86EE29D8B9459E0BC0A56E12C8DA30AE747051909CF16136D3",  # noqa: mock
+    "ledger_index": 89692233,
+    "validated": True,
+    "limit": 200,
+    "lines": [
+        {
+            "account": "rvYAfWj5gh67oV6fW32ZzP3Aw4Eubs59B",  # noqa: mock
+            "balance": "0.9957725256649131",
+            "currency": "USD",
+            "limit": "0",
+            "limit_peer": "0",
+            "quality_in": 0,
+            "quality_out": 0,
+            "no_ripple": True,
+            "no_ripple_peer": False,
+        },
+        {
+            "account": "rcEGREd8NmkKRE8GE424sksyt1tJVFZwu",  # noqa: mock
+            "balance": "2.981957518895808",
+            "currency": _USDC_CURRENCY,
+            "limit": "0",
+            "limit_peer": "0",
+            "quality_in": 0,
+            "quality_out": 0,
+            "no_ripple": True,
+            "no_ripple_peer": False,
+        },
+        {
+            "account": "rhub8VRN55s94qWKDv6jmDy1pUykJzF3wq",  # noqa: mock
+            "balance": "0.011094399237562",
+            "currency": "USD",
+            "limit": "0",
+            "limit_peer": "0",
+            "quality_in": 0,
+            "quality_out": 0,
+            "no_ripple": True,
+            "no_ripple_peer": False,
+        },
+        {
+            "account": "rpakCr61Q92abPXJnVboKENmpKssWyHpwu",  # noqa: mock
+            "balance": "104.9021857197376",
+            "currency": "457175696C69627269756D000000000000000000",  # noqa: mock
+            "limit": "0",
+            "limit_peer": "0",
+            "quality_in": 0,
+            "quality_out": 0,
+            "no_ripple": True,
+            "no_ripple_peer": False,
+        },
+        {
+            "account": _SOLO_ISSUER,
+            "balance": "35.95165691730148",
+            "currency": _SOLO_CURRENCY,
+            "limit": "1000000000",
+            "limit_peer": "0",
+            "quality_in": 0,
+            "quality_out": 0,
+            "no_ripple": True,
+            "no_ripple_peer": False,
+        },
+    ],
+}
+
+_ACCOUNT_OBJECTS_RESULT = {
+    "account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+    "account_objects": [
+        {
+            "Balance": {
+                "currency": _USDC_CURRENCY,
+                "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
+                "value": "2.981957518895808",
+            },
+            "Flags": 1114112,
+            "HighLimit": {
+                "currency": _USDC_CURRENCY,
+                "issuer": "rcEGREd8NmkKRE8GE424sksyt1tJVFZwu",  # noqa: mock
+                "value": "0",
+            },
+            "HighNode": "f9",
+            "LedgerEntryType": "RippleState",
+            "LowLimit": {
+                "currency": _USDC_CURRENCY,
+                "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+                "value": "0",
+            },
+            "LowNode": "0",
+            "PreviousTxnID": "C6EFE5E21ABD5F457BFCCE6D5393317B90821F443AD41FF193620E5980A52E71",  # noqa: mock
+            "PreviousTxnLgrSeq": 86277627,
+            "index": "55049B8164998B0566FC5CDB3FC7162280EFE5A84DB9333312D3DFF98AB52380",  # noqa: mock
+        },
+        {
+            "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+            "BookDirectory": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F10652F287D59AD",  # noqa: mock
+            "BookNode": "0",
+            "Flags": 131072,
+            "LedgerEntryType": "Offer",
+            "OwnerNode": "0",
+            "PreviousTxnID": "44038CD94CDD0A6FD7912F788FA5FBC575A3C44948E31F4C21B8BC3AA0C2B643",  # noqa: mock
+            "PreviousTxnLgrSeq": 89078756,
+            "Sequence": 84439998,
+            "TakerGets": "499998",
+            "TakerPays": {**_SOLO_AMOUNT, "value": "2.307417192565501"},
+            "index": "BE4ACB6610B39F2A9CD1323F63D479177917C02AA8AF2122C018D34AAB6F4A35",  # noqa: mock
+        },
+        {
+            "Balance": {
+                "currency": "USD",
+                "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
+                "value": "0.011094399237562",
+            },
+            "Flags": 1114112,
+            "HighLimit": {
+                "currency": "USD",
+                "issuer": "rhub8VRN55s94qWKDv6jmDy1pUykJzF3wq",  # noqa: mock
+                "value": "0",
+            },
+            "HighNode": "22d3",
+            "LedgerEntryType": "RippleState",
+            "LowLimit": {
+                "currency": "USD",
+                "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+                "value": "0",
+            },
+            "LowNode": "0",
+            "PreviousTxnID": "1A9E685EA694157050803B76251C0A6AFFCF1E69F883BF511CF7A85C3AC002B8",  # noqa: mock
+            "PreviousTxnLgrSeq": 85648064,
+            "index": "C510DDAEBFCE83469032E78B9F41D352DABEE2FB454E6982AA5F9D4ECC4D56AA",  # noqa: mock
+        },
+        {
+            "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+            "BookDirectory": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F10659A9DE833CA",  # noqa: mock
+            "BookNode": "0",
+            "Flags": 131072,
+            "LedgerEntryType": "Offer",
+            "OwnerNode": "0",
+            "PreviousTxnID": "262201134A376F2E888173680EDC4E30E2C07A6FA94A8C16603EB12A776CBC66",  # noqa: mock
+            "PreviousTxnLgrSeq": 89078756,
+            "Sequence": 84439997,
+            "TakerGets": "499998",
+            "TakerPays": {**_SOLO_AMOUNT, "value": "2.307647957361237"},
+            "index": "D6F2B37690FA7540B7640ACC61AA2641A6E803DAF9E46CC802884FA5E1BF424E",  # noqa: mock
+        },
+        {
+            "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+            "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07B39757FA194D",  # noqa: mock
+            "BookNode": "0",
+            "Flags": 131072,
+            "LedgerEntryType": "Offer",
+            "OwnerNode": "0",
+            "PreviousTxnID": "254F74BF0E5A2098DDE998609F4E8697CCF6A7FD61D93D76057467366A18DA24",  # noqa: mock
+            "PreviousTxnLgrSeq": 89078757,
+            "Sequence": 84440000,
+            "TakerGets": {**_SOLO_AMOUNT, "value": "2.30649459472761"},
+            "TakerPays": "499999",
+            "index": "D8F57C7C230FA5DE98E8FEB6B75783693BDECAD1266A80538692C90138E7BADE",  # noqa: mock
+        },
+        {
+            "Balance": {
+                "currency": _SOLO_CURRENCY,
+                "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
+                "value": "47.21480375660969",
+            },
+            "Flags": 1114112,
+            "HighLimit": {**_SOLO_AMOUNT, "value": "0"},
+            "HighNode": "3799",
+            "LedgerEntryType": "RippleState",
+            "LowLimit": {
+                "currency": _SOLO_CURRENCY,
+                "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+                "value": "1000000000",
+            },
+            "LowNode": "0",
+            "PreviousTxnID": "E1260EC17725167D0407F73F6B73D7DAF1E3037249B54FC37F2E8B836703AB95",  # noqa: mock
+            "PreviousTxnLgrSeq": 89077268,
+            "index": "E1C84325F137AD05CB78F59968054BCBFD43CB4E70F7591B6C3C1D1C7E44C6FC",  # noqa: mock
+        },
+        {
+            "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
+            "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07B2FFFC6A7DA8",  # noqa: mock
+            "BookNode": "0",
+            "Flags": 131072,
+            "LedgerEntryType": "Offer",
+            "OwnerNode": "0",
+            "PreviousTxnID": "819FF36C6F44F3F858B25580F1E3A900F56DCC59F2398626DB35796AF9E47E7A",  # noqa: mock
+            "PreviousTxnLgrSeq": 89078756,
+            "Sequence": 84439999,
+            "TakerGets": {**_SOLO_AMOUNT, "value": "2.307186473918109"},
+            "TakerPays": "499999",
+            "index": "ECF76E93DBD7923D0B352A7719E5F9BBF6A43D5BA80173495B0403C646184301",  # noqa: mock
+        },
+    ],
+    "ledger_hash": "5A76A3A3D115DBC7CE0E4D9868D1EA15F593C8D74FCDF1C0153ED003B5621671",  # noqa: mock
+    "ledger_index": 89078774,
+    "limit": 200,
+    "validated": True,
+}
+
+_ACCOUNT_INFO_ISSUER_RESULT = {
+    "account_data": {
+        "Account": _SOLO_ISSUER,
+        "Balance": "7329544278",
+        "Domain": "736F6C6F67656E69632E636F6D",  # noqa: mock
+        "EmailHash": "7AC3878BF42A5329698F468A6AAA03B9",  # noqa: mock
+        "Flags": 12058624,
+        "LedgerEntryType": "AccountRoot",
+        "OwnerCount": 0,
+        "PreviousTxnID": "C35579B384BE5DBE064B4778C4EDD18E1388C2CAA2C87BA5122C467265FC7A79",  # noqa: mock
+        "PreviousTxnLgrSeq": 89004092,
+        "RegularKey": "rrrrrrrrrrrrrrrrrrrrBZbvji",
+        "Sequence": 14,
+        "TransferRate": 1000100000,
+        "index": "ED3EE6FAB9822943809FBCBEEC44F418D76292A355B38C1224A378AEB3A65D6D",  # noqa: mock
+        "urlgravatar": "http://www.gravatar.com/avatar/7ac3878bf42a5329698f468a6aaa03b9",  # noqa: mock
+    },
+    "account_flags": {
+        "allowTrustLineClawback": False,
+        "defaultRipple": True,
+        "depositAuth": False,
+        "disableMasterKey": True,
+        "disallowIncomingCheck": False,
+        "disallowIncomingNFTokenOffer": False,
+        "disallowIncomingPayChan": False,
+        "disallowIncomingTrustline": False,
+        "disallowIncomingXRP": True,
+        "globalFreeze": False,
+        "noFreeze": True,
+        "passwordSpent": False,
+        "requireAuthorization": False,
+        "requireDestinationTag": False,
+    },
+    "ledger_hash": "AE78A574FCD1B45135785AC9FB64E7E0E6E4159821EF0BB8A59330C1B0E047C9",  # noqa: mock
+    "ledger_index": 89004663,
+    "validated": True,
+}
+
+_ACCOUNT_INFO_RESPONSE = Response(
+    status=ResponseStatus.SUCCESS,
+    result=_ACCOUNT_INFO_RESULT,
+    id="account_info_644216",
+    type=ResponseType.RESPONSE,
+)
+_ACCOUNT_LINES_RESPONSE = Response(
+    status=ResponseStatus.SUCCESS,
+    result=_ACCOUNT_LINES_RESULT,
+    id="account_lines_144811",
+    type=ResponseType.RESPONSE,
+)
+_ACCOUNT_OBJECTS_RESPONSE = Response(
+    status=ResponseStatus.SUCCESS,
+    result=_ACCOUNT_OBJECTS_RESULT,
+    id="account_objects_144811",
+    type=ResponseType.RESPONSE,
+)
+_ACCOUNT_INFO_ISSUER_RESPONSE = Response(
+    status=ResponseStatus.SUCCESS,
+    result=_ACCOUNT_INFO_ISSUER_RESULT,
+    id="account_info_73967",
+    type=ResponseType.RESPONSE,
+)
+
+
+class XRPLAPIOrderBookDataSourceUnitTests(LocalClassEventLoopWrapperTestCase):
     # logging.Level required to receive logs from the data source logger
     level = 0
 
     @classmethod
     def setUpClass(cls) -> None:
         super().setUpClass()
-        cls.ev_loop = asyncio.get_event_loop()
         cls.base_asset = "SOLO"
         cls.quote_asset = "XRP"
         cls.trading_pair = f"{cls.base_asset}-{cls.quote_asset}"
         cls.trading_pair_usd = f"{cls.base_asset}-USD"
+        cls.trading_pairs = [cls.trading_pair, cls.trading_pair_usd]
+        cls.trading_rules_info = {
+            cls.trading_pair: {"base_transfer_rate": 0.01, "quote_transfer_rate": 0.01},
+            cls.trading_pair_usd: {"base_transfer_rate": 0.01, "quote_transfer_rate": 0.01},
+        }
+
+        cls.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        cls.auth = XRPLAuth(xrpl_secret_key="")
+        cls.shared_mocks = {}
+        template_connector = cls._create_connector()
+        cls.trading_pair_fee_rules = template_connector._format_trading_pair_fee_rules(cls.trading_rules_info)
+        template_connector._initialize_trading_pair_symbols_from_exchange_info(CONSTANTS.MARKETS)
+        cls.trading_pair_symbol_map = cls.local_event_loop.run_until_complete(
+            template_connector.trading_pair_symbol_map()
+        )
+        # Only handed to read-only lookups; tests that go through order updates build their own order
+        cls.limit_buy_order = InFlightOrder(
+            client_order_id="hbot",
+            exchange_order_id="84437895-88954510",
+            trading_pair=cls.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=_ORDER_AMOUNT,
+            price=_ORDER_PRICE,
+            creation_timestamp=1,
+        )
+
+    @classmethod
+    def _create_connector(cls) -> XrplExchange:
+        with patch.object(XrplExchange, "authenticator", new_callable=PropertyMock, return_value=cls.auth):
+            return XrplExchange(
+                client_config_map=cls.client_config_map,
+                xrpl_secret_key="",
+                wss_node_url="wss://sample.com",
+                wss_second_node_url="wss://sample.com",
+                wss_third_node_url="wss://sample.com",
+                trading_pairs=list(cls.trading_pairs),
+                trading_required=False,
+            )
 
     def setUp(self) -> None:
         super().setUp()
         self.log_records = []
         self.listening_task = None
 
-        client_config_map = ClientConfigAdapter(ClientConfigMap())
-        self.connector = XrplExchange(
-            client_config_map=client_config_map,
-            xrpl_secret_key="",
-            wss_node_url="wss://sample.com",
-            wss_second_node_url="wss://sample.com",
-            wss_third_node_url="wss://sample.com",
-            trading_pairs=[self.trading_pair, self.trading_pair_usd],
-            trading_required=False,
-        )
+        # Construction is cheap and does no I/O; tests replace connector methods and leave orders behind,
+        # so each one gets its own instance rather than a shared one with hand-reset state
+        self.connector = self._create_connector()
         self.data_source = XRPLAPIOrderBookDataSource(
-            trading_pairs=[self.trading_pair, self.trading_pair_usd],
+            trading_pairs=list(self.trading_pairs),
             connector=self.connector,
             api_factory=self.connector._web_assistants_factory,
         )
         self.data_source.logger().setLevel(1)
         self.data_source.logger().addHandler(self)
-        self.data_source._request_order_book_snapshot = AsyncMock()
-        self.data_source._request_order_book_snapshot.return_value = self._snapshot_response()
+        self.addCleanup(self.data_source.logger().removeHandler, self)
+        self.data_source._request_order_book_snapshot = _make_async_return(self._snapshot_response())
 
         self._original_full_order_book_reset_time = self.data_source.FULL_ORDER_BOOK_RESET_DELTA_SECONDS
         self.data_source.FULL_ORDER_BOOK_RESET_DELTA_SECONDS = -1
         self.resume_test_event = asyncio.Event()
 
-        exchange_market_info = CONSTANTS.MARKETS
-        self.connector._initialize_trading_pair_symbols_from_exchange_info(exchange_market_info)
+        self.connector._set_trading_pair_symbol_map(self.trading_pair_symbol_map.copy())
 
-        trading_rule = TradingRule(
-            trading_pair=self.trading_pair,
-            min_order_size=Decimal("1e-6"),
-            min_price_increment=Decimal("1e-6"),
-            min_quote_amount_increment=Decimal("1e-6"),
-            min_base_amount_increment=Decimal("1e-15"),
-            min_notional_size=Decimal("1e-6"),
-        )
+        self.connector._trading_rules[self.trading_pair] = _TRADING_RULE_SOLO_XRP
+        self.connector._trading_rules[self.trading_pair_usd] = _TRADING_RULE_SOLO_USD
 
-        trading_rule_usd = TradingRule(
-            trading_pair=self.trading_pair_usd,
-            min_order_size=Decimal("1e-6"),
-            min_price_increment=Decimal("1e-6"),
-            min_quote_amount_increment=Decimal("1e-6"),
-            min_base_amount_increment=Decimal("1e-6"),
-            min_notional_size=Decimal("1e-6"),
-        )
+        for trading_pair_fee_rule in self.trading_pair_fee_rules:
+            self.connector._trading_pair_fee_rules[trading_pair_fee_rule["trading_pair"]] = dict(trading_pair_fee_rule)
 
-        self.connector._trading_rules[self.trading_pair] = trading_rule
-        self.connector._trading_rules[self.trading_pair_usd] = trading_rule_usd
+        self.data_source._xrpl_client = _make_async_cm_mock()
 
-        trading_rules_info = {
-            self.trading_pair: {"base_transfer_rate": 0.01, "quote_transfer_rate": 0.01},
-            self.trading_pair_usd: {"base_transfer_rate": 0.01, "quote_transfer_rate": 0.01},
-        }
-        trading_pair_fee_rules = self.connector._format_trading_pair_fee_rules(trading_rules_info)
+        self.connector._orderbook_ds = self.data_source
+
+        self.connector._xrpl_query_client = _make_async_cm_mock()
+        self.connector._xrpl_place_order_client = _make_async_cm_mock()
 
-        for trading_pair_fee_rule in trading_pair_fee_rules:
-            self.connector._trading_pair_fee_rules[trading_pair_fee_rule["trading_pair"]] = trading_pair_fee_rule
+    def tearDown(self) -> None:
+        self.listening_task and self.listening_task.cancel()
+        self.data_source.FULL_ORDER_BOOK_RESET_DELTA_SECONDS = self._original_full_order_book_reset_time
+        del self.connector, self.data_source, self.log_records
+        super().tearDown()
 
-        self.data_source._xrpl_client = AsyncMock()
-        self.data_source._xrpl_client.__aenter__.return_value = self.data_source._xrpl_client
-        self.data_source._xrpl_client.__aexit__.return_value = None
+    def handle(self, record):
+        self.log_records.append(record)
 
-        self.connector._orderbook_ds = self.data_source
+    def _start_order_book_tracker(self):
         self.connector._set_order_book_tracker(
             OrderBookTracker(
                 data_source=self.connector._orderbook_ds,
@@ -113,47 +969,74 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                 domain=self.connector.domain,
             )
         )
-
         self.connector.order_book_tracker.start()
+        self.addCleanup(self.connector.order_book_tracker.stop)
+
+    def _patch_shared(self, *targets: str) -> List[MagicMock]:
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        mocks = []
+        for target in targets:
+            mock = self.shared_mocks.get(target)
+            if mock is None:
+                mock = self.shared_mocks[target] = stack.enter_context(patch(target))
+            else:
+                stack.enter_context(patch(target, new=mock))
+            stack.callback(mock.reset_mock, return_value=True, side_effect=True)
+            mocks.append(mock)
+        return mocks
+
+    def _patch_order_submission(self) -> List[MagicMock]:
+        return self._patch_shared(*_ORDER_SUBMISSION_TARGETS)
+
+    def _collect_spawned_tasks(self) -> List[asyncio.Future]:
+        # buy() and sell() schedule their order creation; collecting the tasks lets a test finish them under its
+        # own patches instead of leaving them to run during whichever test drives the shared loop next
+        spawned_tasks = []
+
+        def _ensure_future(coro, *args, **kwargs):
+            task = safe_ensure_future(coro, *args, **kwargs)
+            spawned_tasks.append(task)
+            return task
+
+        patcher = patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.safe_ensure_future", new=_ensure_future)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return spawned_tasks
+
+    def _create_hbot_order(self, **kwargs) -> InFlightOrder:
+        order_kwargs = {
+            "client_order_id": "hbot",
+            "trading_pair": self.trading_pair,
+            "order_type": OrderType.LIMIT,
+            "trade_type": TradeType.BUY,
+            "amount": _D_1,
+            "price": _D_1,
+            "creation_timestamp": 1,
+        }
+        order_kwargs.update(kwargs)
+        return InFlightOrder(**order_kwargs)
 
-        self.user_stream_source = XRPLAPIUserStreamDataSource(
-            auth=XRPLAuth(xrpl_secret_key=""),
-            connector=self.connector,
-        )
-        self.user_stream_source.logger().setLevel(1)
-        self.user_stream_source.logger().addHandler(self)
-        self.user_stream_source._xrpl_client = AsyncMock()
-        self.user_stream_source._xrpl_client.__aenter__.return_value = self.data_source._xrpl_client
-        self.user_stream_source._xrpl_client.__aexit__.return_value = None
-
-        self.connector._user_stream_tracker = UserStreamTracker(data_source=self.user_stream_source)
-
-        self.connector._xrpl_query_client = AsyncMock()
-        self.connector._xrpl_query_client.__aenter__.return_value = self.connector._xrpl_query_client
-        self.connector._xrpl_query_client.__aexit__.return_value = None
-
-        self.connector._xrpl_place_order_client = AsyncMock()
-        self.connector._xrpl_place_order_client.__aenter__.return_value = self.connector._xrpl_place_order_client
-        self.connector._xrpl_place_order_client.__aexit__.return_value = None
-
-    def tearDown(self) -> None:
-        self.listening_task and self.listening_task.cancel()
-        self.data_source.FULL_ORDER_BOOK_RESET_DELTA_SECONDS = self._original_full_order_book_reset_time
-        super().tearDown()
+    def _capture_connector_logs(self):
+        self.connector.logger().addHandler(self)
+        self.addCleanup(self.connector.logger().removeHandler, self)
 
-    def handle(self, record):
-        self.log_records.append(record)
+    def _clear_logs(self):
+        self.log_records.clear()
 
-    def _is_logged(self, log_level: str, message: str) -> bool:
-        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+    def _logged_errors(self) -> List[Tuple[str, str]]:
+        return [(record.name, record.getMessage()) for record in self.log_records if record.levelname == "ERROR"]
 
     def _create_exception_and_unlock_test_with_event(self, exception):
         self.resume_test_event.set()
         raise exception
 
-    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
-        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
-        return ret
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5) -> Any:
+        return self.local_event_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _run(self, coroutine: Awaitable) -> Any:
+        # Only for coroutines that resolve entirely against mocks; anything that can sleep or retry keeps the timeout
+        return self.local_event_loop.run_until_complete(coroutine)
 
     def _trade_update_event(self):
         trade_data = {
@@ -161,7 +1044,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             "trade_id": "example_trade_id",
             "update_id": 123456789,
             "price": Decimal("0.001"),
-            "amount": Decimal("1"),
+            "amount": _D_1,
             "timestamp": 123456789,
         }
 
@@ -169,1007 +1052,188 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         return resp
 
     def _snapshot_response(self):
-        resp = {
-            "asks": [
-                {
-                    "Account": "r9aZRryD8AZzGqQjYrQQuBBzebjF555Xsa",  # noqa: mock
-                    "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07FA0FAB195976",  # noqa: mock
-                    "BookNode": "0",
-                    "Flags": 131072,
-                    "LedgerEntryType": "Offer",
-                    "OwnerNode": "0",
-                    "PreviousTxnID": "373EA7376A1F9DC150CCD534AC0EF8544CE889F1850EFF0084B46997DAF4F1DA",  # noqa: mock
-                    "PreviousTxnLgrSeq": 88935730,
-                    "Sequence": 86514258,
-                    "TakerGets": {
-                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                        "value": "91.846106",
-                    },
-                    "TakerPays": "20621931",
-                    "index": "1395ACFB20A47DE6845CF5DB63CF2E3F43E335D6107D79E581F3398FF1B6D612",  # noqa: mock
-                    "owner_funds": "140943.4119268388",
-                    "quality": "224527.003899327",
-                },
-                {
-                    "Account": "rhqTdSsJAaEReRsR27YzddqyGoWTNMhEvC",  # noqa: mock
-                    "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07FA8ECFD95726",  # noqa: mock
-                    "BookNode": "0",
-                    "Flags": 0,
-                    "LedgerEntryType": "Offer",
-                    "OwnerNode": "2",
-                    "PreviousTxnID": "2C266D54DDFAED7332E5E6EC68BF08CC37CE2B526FB3CFD8225B667C4C1727E1",  # noqa: mock
-                    "PreviousTxnLgrSeq": 88935726,
-                    "Sequence": 71762354,
-                    "TakerGets": {
-                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                        "value": "44.527243023",
-                    },
-                    "TakerPays": "10000000",
-                    "index": "186D33545697D90A5F18C1541F2228A629435FC540D473574B3B75FEA7B4B88B",  # noqa: mock
-                    "owner_funds": "88.4155435721498",
-                    "quality": "224581.6116401958",
-                },
-            ],
-            "bids": [
-                {
-                    "Account": "rn3uVsXJL7KRTa7JF3jXXGzEs3A2UEfett",  # noqa: mock
-                    "BookDirectory": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F0FE48CEADD8471",  # noqa: mock
-                    "BookNode": "0",
-                    "Flags": 0,
-                    "LedgerEntryType": "Offer",
-                    "OwnerNode": "0",
-                    "PreviousTxnID": "2030FB97569D955921659B150A2F5F02CC9BBFCA95BAC6B8D55D141B0ABFA945",  # noqa: mock
-                    "PreviousTxnLgrSeq": 88935721,
-                    "Sequence": 74073461,
-                    "TakerGets": "187000000",
-                    "TakerPays": {
-                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                        "value": "836.5292665312212",
-                    },
-                    "index": "3F41585F327EA3690AD19F2A302C5DF2904E01D39C9499B303DB7FA85868B69F",  # noqa: mock
-                    "owner_funds": "6713077567",
-                    "quality": "0.000004473418537600113",
-                },
-                {
-                    "Account": "rsoLoDTcxn9wCEHHBR7enMhzQMThkB2w28",  # noqa: mock
-                    "BookDirectory": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F0FE48D021C71F2",  # noqa: mock
-                    "BookNode": "0",
-                    "Expiration": 772644742,
-                    "Flags": 0,
-                    "LedgerEntryType": "Offer",
-                    "OwnerNode": "0",
-                    "PreviousTxnID": "226434A5399E210F82F487E8710AE21FFC19FE86FC38F3634CF328FA115E9574",  # noqa: mock
-                    "PreviousTxnLgrSeq": 88935719,
-                    "Sequence": 69870875,
-                    "TakerGets": "90000000",
-                    "TakerPays": {
-                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                        "value": "402.6077034840102",
-                    },
-                    "index": "4D31D069F1E2B0F2016DA0F1BF232411CB1B4642A49538CD6BB989F353D52411",  # noqa: mock
-                    "owner_funds": "827169016",
-                    "quality": "0.000004473418927600114",
-                },
-            ],
-            "trading_pair": "SOLO-XRP",
-        }
-
-        return resp
+        return pickle.loads(_SNAPSHOT_PICKLE)
 
-    # noqa: mock
     def _event_message(self):
-        resp = {
-            "transaction": {
-                "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                "Fee": "10",
-                "Flags": 786432,
-                "LastLedgerSequence": 88954510,
-                "Memos": [
-                    {
-                        "Memo": {
-                            "MemoData": "68626F742D313731393430303738313137303331392D42534F585036316263393330633963366139393139386462343432343461383637313231373562313663"  # noqa: mock
-                        }
-                    }
-                ],
-                "Sequence": 84437780,
-                "SigningPubKey": "ED23BA20D57103E05BA762F0A04FE50878C11BD36B7BF9ADACC3EDBD9E6D320923",  # noqa: mock
-                "TakerGets": "502953",
-                "TakerPays": {
-                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                    "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                    "value": "2.239836701211152",
-                },
-                "TransactionType": "OfferCreate",
-                "TxnSignature": "2E87E743DE37738DCF1EE6C28F299C4FF18BDCB064A07E9068F1E920F8ACA6C62766177E82917ED0995635E636E3BB8B4E2F4DDCB198B0B9185041BEB466FD03",  # noqa: mock
-                "hash": "undefined",
-                "ctid": "C54D567C00030000",  # noqa: mock
-                "meta": "undefined",
-                "validated": "undefined",
-                "date": 772789130,
-                "ledger_index": "undefined",
-                "inLedger": "undefined",
-                "metaData": "undefined",
-                "status": "undefined",
-            },
-            "meta": {
-                "AffectedNodes": [
-                    {
-                        "ModifiedNode": {
-                            "FinalFields": {
-                                "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                                "Balance": "56148988",
-                                "Flags": 0,
-                                "OwnerCount": 3,
-                                "Sequence": 84437781,
-                            },
-                            "LedgerEntryType": "AccountRoot",
-                            "LedgerIndex": "2B3020738E7A44FBDE454935A38D77F12DC5A11E0FA6DAE2D9FCF4719FFAA3BC",  # noqa: mock
-                            "PreviousFields": {"Balance": "56651951", "Sequence": 84437780},
-                            "PreviousTxnID": "BCBB6593A916EDBCC84400948B0525BE7E972B893111FE1C89A7519F8A5ACB2B",  # noqa: mock
-                            "PreviousTxnLgrSeq": 88954461,
-                        }
-                    },
-                    {
-                        "ModifiedNode": {
-                            "FinalFields": {
-                                "Account": "rhqTdSsJAaEReRsR27YzddqyGoWTNMhEvC",  # noqa: mock
-                                "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07F01A195F8476",  # noqa: mock
-                                "BookNode": "0",
-                                "Flags": 0,
-                                "OwnerNode": "2",
-                                "Sequence": 71762948,
-                                "TakerGets": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                    "value": "42.50531785780174",
-                                },
-                                "TakerPays": "9497047",
-                            },
-                            "LedgerEntryType": "Offer",
-                            "LedgerIndex": "3ABFC9B192B73ECE8FB6E2C46E49B57D4FBC4DE8806B79D913C877C44E73549E",  # noqa: mock
-                            "PreviousFields": {
-                                "TakerGets": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                    "value": "44.756352009",
-                                },
-                                "TakerPays": "10000000",
-                            },
-                            "PreviousTxnID": "7398CE2FDA7FF61B52C1039A219D797E526ACCCFEC4C44A9D920ED28B551B539",  # noqa: mock
-                            "PreviousTxnLgrSeq": 88954480,
-                        }
-                    },
-                    {
-                        "ModifiedNode": {
-                            "FinalFields": {
-                                "Account": "rhqTdSsJAaEReRsR27YzddqyGoWTNMhEvC",  # noqa: mock
-                                "Balance": "251504663",
-                                "Flags": 0,
-                                "OwnerCount": 30,
-                                "Sequence": 71762949,
-                            },
-                            "LedgerEntryType": "AccountRoot",
-                            "LedgerIndex": "4F7BC1BE763E253402D0CA5E58E7003D326BEA2FEB5C0FEE228660F795466F6E",  # noqa: mock
-                            "PreviousFields": {"Balance": "251001710"},
-                            "PreviousTxnID": "7398CE2FDA7FF61B52C1039A219D797E526ACCCFEC4C44A9D920ED28B551B539",  # noqa: mock
-                            "PreviousTxnLgrSeq": 88954480,
-                        }
-                    },
-                    {
-                        "ModifiedNode": {
-                            "FinalFields": {
-                                "Balance": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
-                                    "value": "-195.4313653751863",
-                                },
-                                "Flags": 2228224,
-                                "HighLimit": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rhqTdSsJAaEReRsR27YzddqyGoWTNMhEvC",  # noqa: mock
-                                    "value": "399134226.5095641",
-                                },
-                                "HighNode": "0",
-                                "LowLimit": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                    "value": "0",
-                                },
-                                "LowNode": "36a5",
-                            },
-                            "LedgerEntryType": "RippleState",
-                            "LedgerIndex": "9DB660A1BF3B982E5A8F4BE0BD4684FEFEBE575741928E67E4EA1DAEA02CA5A6",  # noqa: mock
-                            "PreviousFields": {
-                                "Balance": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
-                                    "value": "-197.6826246297997",
-                                }
-                            },
-                            "PreviousTxnID": "BCBB6593A916EDBCC84400948B0525BE7E972B893111FE1C89A7519F8A5ACB2B",  # noqa: mock
-                            "PreviousTxnLgrSeq": 88954461,
-                        }
-                    },
-                    {
-                        "ModifiedNode": {
-                            "FinalFields": {
-                                "Balance": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
-                                    "value": "45.47502732568766",
-                                },
-                                "Flags": 1114112,
-                                "HighLimit": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                    "value": "0",
-                                },
-                                "HighNode": "3799",
-                                "LowLimit": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                                    "value": "1000000000",
-                                },
-                                "LowNode": "0",
-                            },
-                            "LedgerEntryType": "RippleState",
-                            "LedgerIndex": "E1C84325F137AD05CB78F59968054BCBFD43CB4E70F7591B6C3C1D1C7E44C6FC",  # noqa: mock
-                            "PreviousFields": {
-                                "Balance": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
-                                    "value": "43.2239931744894",
-                                }
-                            },
-                            "PreviousTxnID": "BCBB6593A916EDBCC84400948B0525BE7E972B893111FE1C89A7519F8A5ACB2B",  # noqa: mock
-                            "PreviousTxnLgrSeq": 88954461,
-                        }
-                    },
-                ],
-                "TransactionIndex": 3,
-                "TransactionResult": "tesSUCCESS",
-            },
-            "hash": "86440061A351FF77F21A24ED045EE958F6256697F2628C3555AEBF29A887518C",  # noqa: mock
-            "ledger_index": 88954492,
-            "date": 772789130,
-        }
-
-        return resp
+        return pickle.loads(_EVENT_MESSAGE_PICKLE)
 
     def _event_message_limit_order_partially_filled(self):
-        resp = {
-            "transaction": {
-                "Account": "rapido5rxPmP4YkMZZEeXSHqWefxHEkqv6",  # noqa: mock
-                "Fee": "10",
-                "Flags": 655360,
-                "LastLedgerSequence": 88981161,
-                "Memos": [
-                    {
-                        "Memo": {
-                            "MemoData": "06574D47B3D98F0D1103815555734BF30D72EC4805086B873FCCD69082FE00903FF7AC1910CF172A3FD5554FBDAD75193FF00068DB8BAC71"  # noqa: mock
-                        }
-                    }
-                ],
-                "Sequence": 2368849,
-                "SigningPubKey": "EDE30BA017ED458B9B372295863B042C2BA8F11AD53B4BDFB398E778CB7679146B",  # noqa: mock
-                "TakerGets": {
-                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                    "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                    "value": "1.479368155160602",
-                },
-                "TakerPays": "333",
-                "TransactionType": "OfferCreate",
-                "TxnSignature": "1165D0B39A5C3C48B65FD20DDF1C0AF544B1413C8B35E6147026F521A8468FB7F8AA3EAA33582A9D8DC9B56E1ED59F6945781118EC4DEC92FF639C3D41C3B402",  # noqa: mock
-                "hash": "undefined",
-                "ctid": "C54DBEA8001D0000",  # noqa: mock
-                "meta": "undefined",
-                "validated": "undefined",
-                "date": 772789130,
-                "ledger_index": "undefined",
-                "inLedger": "undefined",
-                "metaData": "undefined",
-                "status": "undefined",
-            },
-            "meta": {
-                "AffectedNodes": [
-                    {
-                        "ModifiedNode": {
-                            "FinalFields": {
-                                "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                                "Balance": "57030924",
-                                "Flags": 0,
-                                "OwnerCount": 9,
-                                "Sequence": 84437901,
-                            },
-                            "LedgerEntryType": "AccountRoot",
-                            "LedgerIndex": "2B3020738E7A44FBDE454935A38D77F12DC5A11E0FA6DAE2D9FCF4719FFAA3BC",  # noqa: mock
-                            "PreviousFields": {"Balance": "57364223"},
-                            "PreviousTxnID": "1D63D9DFACB8F25ADAF44A1976FBEAF875EF199DEA6F9502B1C6C32ABA8583F6",  # noqa: mock
-                            "PreviousTxnLgrSeq": 88981158,
-                        }
-                    },
-                    {
-                        "ModifiedNode": {
-                            "FinalFields": {
-                                "Account": "rapido5rxPmP4YkMZZEeXSHqWefxHEkqv6",  # noqa: mock
-                                "AccountTxnID": "602B32630738581F2618849B3338401D381139F8458DDF2D0AC9B61BEED99D70",  # noqa: mock
-                                "Balance": "4802538039",
-                                "Flags": 0,
-                                "OwnerCount": 229,
-                                "Sequence": 2368850,
-                            },
-                            "LedgerEntryType": "AccountRoot",
-                            "LedgerIndex": "BFF40FB02870A44349BB5E482CD2A4AA3415C7E72F4D2E9E98129972F26DA9AA",  # noqa: mock
-                            "PreviousFields": {
-                                "AccountTxnID": "43B7820240604D3AFE46079D91D557259091DDAC17D42CD7688637D58C3B7927",  # noqa: mock
-                                "Balance": "4802204750",
-                                "Sequence": 2368849,
-                            },
-                            "PreviousTxnID": "43B7820240604D3AFE46079D91D557259091DDAC17D42CD7688637D58C3B7927",  # noqa: mock
-                            "PreviousTxnLgrSeq": 88981160,
-                        }
-                    },
-                    {
-                        "ModifiedNode": {
-                            "FinalFields": {
-                                "Balance": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
-                                    "value": "41.49115329259071",
-                                },
-                                "Flags": 1114112,
-                                "HighLimit": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                    "value": "0",
-                                },
-                                "HighNode": "3799",
-                                "LowLimit": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                                    "value": "1000000000",
-                                },
-                                "LowNode": "0",
-                            },
-                            "LedgerEntryType": "RippleState",
-                            "LedgerIndex": "E1C84325F137AD05CB78F59968054BCBFD43CB4E70F7591B6C3C1D1C7E44C6FC",  # noqa: mock
-                            "PreviousFields": {
-                                "Balance": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
-                                    "value": "40.01178513743011",
-                                }
-                            },
-                            "PreviousTxnID": "EA21F8D1CD22FA64C98CB775855F53C186BF0AD24D59728AA8D18340DDAA3C57",  # noqa: mock
-                            "PreviousTxnLgrSeq": 88981118,
-                        }
-                    },
-                    {
-                        "ModifiedNode": {
-                            "FinalFields": {
-                                "Balance": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
-                                    "value": "-5.28497026524528",
-                                },
-                                "Flags": 2228224,
-                                "HighLimit": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rapido5rxPmP4YkMZZEeXSHqWefxHEkqv6",  # noqa: mock
-                                    "value": "0",
-                                },
-                                "HighNode": "18",
-                                "LowLimit": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                    "value": "0",
-                                },
-                                "LowNode": "387f",
-                            },
-                            "LedgerEntryType": "RippleState",
-                            "LedgerIndex": "E56AB275B511ECDF6E9C9D8BE9404F3FECBE5C841770584036FF8A832AF3F3B9",  # noqa: mock
-                            "PreviousFields": {
-                                "Balance": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
-                                    "value": "-6.764486357221399",
-                                }
-                            },
-                            "PreviousTxnID": "43B7820240604D3AFE46079D91D557259091DDAC17D42CD7688637D58C3B7927",  # noqa: mock
-                            "PreviousTxnLgrSeq": 88981160,
-                        }
-                    },
-                    {
-                        "ModifiedNode": {
-                            "FinalFields": {
-                                "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                                "BookDirectory": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F0FC4DA2F8AAF5B",  # noqa: mock
-                                "BookNode": "0",
-                                "Flags": 131072,
-                                "OwnerNode": "0",
-                                "Sequence": 84437895,
-                                "TakerGets": "33",
-                                "TakerPays": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                    "value": "0.000147936815515",
-                                },
-                            },
-                            "LedgerEntryType": "Offer",
-                            "LedgerIndex": "F91EFE46023BA559CEF49B670052F19189C8B6422A93FA26D35F2D6A25290D24",  # noqa: mock
-                            "PreviousFields": {
-                                "TakerGets": "333332",
-                                "TakerPays": {
-                                    "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                    "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                    "value": "1.479516091976118",
-                                },
-                            },
-                            "PreviousTxnID": "12A2F4A0FAA21802E68F4BF78BCA3DE302222B0B9FB938C355EE10E931C151D2",  # noqa: mock
-                            "PreviousTxnLgrSeq": 88981157,
-                        }
-                    },
-                ],
-                "TransactionIndex": 29,
-                "TransactionResult": "tesSUCCESS",
-            },
-            "hash": "602B32630738581F2618849B3338401D381139F8458DDF2D0AC9B61BEED99D70",  # noqa: mock
-            "ledger_index": 88981160,
-            "date": 772789130,
-        }
-
-        return resp
-
-    def _client_response_account_info(self):
-        resp = Response(
-            status=ResponseStatus.SUCCESS,
-            result={
-                "account_data": {
-                    "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                    "Balance": "57030864",
-                    "Flags": 0,
-                    "LedgerEntryType": "AccountRoot",
-                    "OwnerCount": 3,
-                    "PreviousTxnID": "0E8031892E910EB8F19537610C36E5816D5BABF14C91CF8C73FFE5F5D6A0623E",  # noqa: mock
-                    "PreviousTxnLgrSeq": 88981167,
-                    "Sequence": 84437907,
-                    "index": "2B3020738E7A44FBDE454935A38D77F12DC5A11E0FA6DAE2D9FCF4719FFAA3BC",  # noqa: mock
-                },
-                "account_flags": {
-                    "allowTrustLineClawback": False,
-                    "defaultRipple": False,
-                    "depositAuth": False,
-                    "disableMasterKey": False,
-                    "disallowIncomingCheck": False,
-                    "disallowIncomingNFTokenOffer": False,
-                    "disallowIncomingPayChan": False,
-                    "disallowIncomingTrustline": False,
-                    "disallowIncomingXRP": False,
-                    "globalFreeze": False,
-                    "noFreeze": False,
-                    "passwordSpent": False,
-                    "requireAuthorization": False,
-                    "requireDestinationTag": False,
-                },
-                "ledger_hash": "DFDFA9B7226B8AC1FD909BB9C2EEBDBADF4C37E2C3E283DB02C648B2DC90318C",  # noqa: mock
-                "ledger_index": 89003974,
-                "validated": True,
-            },
-            id="account_info_644216",
-            type=ResponseType.RESPONSE,
-        )
-
-        return resp
-
-    def _client_response_account_lines(self):
-        resp = Response(
-            status=ResponseStatus.SUCCESS,
-            result={
-                "account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                "ledger_hash": "6626B7AC7E184B86EE29D8B9459E0BC0A56E12C8DA30AE747051909CF16136D3",  # noqa: mock
-                "ledger_index": 89692233,
-                "validated": True,
-                "limit": 200,
-                "lines": [
-                    {
-                        "account": "rvYAfWj5gh67oV6fW32ZzP3Aw4Eubs59B",  # noqa: mock
-                        "balance": "0.9957725256649131",
-                        "currency": "USD",
-                        "limit": "0",
-                        "limit_peer": "0",
-                        "quality_in": 0,
-                        "quality_out": 0,
-                        "no_ripple": True,
-                        "no_ripple_peer": False,
-                    },
-                    {
-                        "account": "rcEGREd8NmkKRE8GE424sksyt1tJVFZwu",  # noqa: mock
-                        "balance": "2.981957518895808",
-                        "currency": "5553444300000000000000000000000000000000",  # noqa: mock
-                        "limit": "0",
-                        "limit_peer": "0",
-                        "quality_in": 0,
-                        "quality_out": 0,
-                        "no_ripple": True,
-                        "no_ripple_peer": False,
-                    },
-                    {
-                        "account": "rhub8VRN55s94qWKDv6jmDy1pUykJzF3wq",  # noqa: mock
-                        "balance": "0.011094399237562",
-                        "currency": "USD",
-                        "limit": "0",
-                        "limit_peer": "0",
-                        "quality_in": 0,
-                        "quality_out": 0,
-                        "no_ripple": True,
-                        "no_ripple_peer": False,
-                    },
-                    {
-                        "account": "rpakCr61Q92abPXJnVboKENmpKssWyHpwu",  # noqa: mock
-                        "balance": "104.9021857197376",
-                        "currency": "457175696C69627269756D000000000000000000",  # noqa: mock
-                        "limit": "0",
-                        "limit_peer": "0",
-                        "quality_in": 0,
-                        "quality_out": 0,
-                        "no_ripple": True,
-                        "no_ripple_peer": False,
-                    },
-                    {
-                        "account": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                        "balance": "35.95165691730148",
-                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                        "limit": "1000000000",
-                        "limit_peer": "0",
-                        "quality_in": 0,
-                        "quality_out": 0,
-                        "no_ripple": True,
-                        "no_ripple_peer": False,
-                    },
-                ],
-            },  # noqa: mock
-            id="account_lines_144811",
-            type=ResponseType.RESPONSE,
-        )
-
-        return resp
-
-    def _client_response_account_objects(self):
-        resp = Response(
-            status=ResponseStatus.SUCCESS,
-            result={
-                "account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                "account_objects": [
-                    {
-                        "Balance": {
-                            "currency": "5553444300000000000000000000000000000000",  # noqa: mock
-                            "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
-                            "value": "2.981957518895808",
-                        },
-                        "Flags": 1114112,
-                        "HighLimit": {
-                            "currency": "5553444300000000000000000000000000000000",  # noqa: mock
-                            "issuer": "rcEGREd8NmkKRE8GE424sksyt1tJVFZwu",  # noqa: mock
-                            "value": "0",
-                        },
-                        "HighNode": "f9",
-                        "LedgerEntryType": "RippleState",
-                        "LowLimit": {
-                            "currency": "5553444300000000000000000000000000000000",  # noqa: mock
-                            "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                            "value": "0",
-                        },
-                        "LowNode": "0",
-                        "PreviousTxnID": "C6EFE5E21ABD5F457BFCCE6D5393317B90821F443AD41FF193620E5980A52E71",  # noqa: mock
-                        "PreviousTxnLgrSeq": 86277627,
-                        "index": "55049B8164998B0566FC5CDB3FC7162280EFE5A84DB9333312D3DFF98AB52380",  # noqa: mock
-                    },
-                    {
-                        "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                        "BookDirectory": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F10652F287D59AD",  # noqa: mock
-                        "BookNode": "0",
-                        "Flags": 131072,
-                        "LedgerEntryType": "Offer",
-                        "OwnerNode": "0",
-                        "PreviousTxnID": "44038CD94CDD0A6FD7912F788FA5FBC575A3C44948E31F4C21B8BC3AA0C2B643",  # noqa: mock
-                        "PreviousTxnLgrSeq": 89078756,
-                        "Sequence": 84439998,
-                        "TakerGets": "499998",
-                        "TakerPays": {
-                            "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                            "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                            "value": "2.307417192565501",
-                        },
-                        "index": "BE4ACB6610B39F2A9CD1323F63D479177917C02AA8AF2122C018D34AAB6F4A35",  # noqa: mock
-                    },
-                    {
-                        "Balance": {
-                            "currency": "USD",
-                            "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
-                            "value": "0.011094399237562",
-                        },
-                        "Flags": 1114112,
-                        "HighLimit": {
-                            "currency": "USD",
-                            "issuer": "rhub8VRN55s94qWKDv6jmDy1pUykJzF3wq",
-                            "value": "0",
-                        },  # noqa: mock
-                        "HighNode": "22d3",
-                        "LedgerEntryType": "RippleState",
-                        "LowLimit": {
-                            "currency": "USD",
-                            "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",
-                            "value": "0",
-                        },  # noqa: mock
-                        "LowNode": "0",
-                        "PreviousTxnID": "1A9E685EA694157050803B76251C0A6AFFCF1E69F883BF511CF7A85C3AC002B8",  # noqa: mock
-                        "PreviousTxnLgrSeq": 85648064,
-                        "index": "C510DDAEBFCE83469032E78B9F41D352DABEE2FB454E6982AA5F9D4ECC4D56AA",  # noqa: mock
-                    },
-                    {
-                        "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                        "BookDirectory": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F10659A9DE833CA",  # noqa: mock
-                        "BookNode": "0",
-                        "Flags": 131072,
-                        "LedgerEntryType": "Offer",
-                        "OwnerNode": "0",
-                        "PreviousTxnID": "262201134A376F2E888173680EDC4E30E2C07A6FA94A8C16603EB12A776CBC66",  # noqa: mock
-                        "PreviousTxnLgrSeq": 89078756,
-                        "Sequence": 84439997,
-                        "TakerGets": "499998",
-                        "TakerPays": {
-                            "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                            "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                            "value": "2.307647957361237",
-                        },
-                        "index": "D6F2B37690FA7540B7640ACC61AA2641A6E803DAF9E46CC802884FA5E1BF424E",  # noqa: mock
-                    },
-                    {
-                        "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                        "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07B39757FA194D",  # noqa: mock
-                        "BookNode": "0",
-                        "Flags": 131072,
-                        "LedgerEntryType": "Offer",
-                        "OwnerNode": "0",
-                        "PreviousTxnID": "254F74BF0E5A2098DDE998609F4E8697CCF6A7FD61D93D76057467366A18DA24",  # noqa: mock
-                        "PreviousTxnLgrSeq": 89078757,
-                        "Sequence": 84440000,
-                        "TakerGets": {
-                            "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                            "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                            "value": "2.30649459472761",
-                        },
-                        "TakerPays": "499999",
-                        "index": "D8F57C7C230FA5DE98E8FEB6B75783693BDECAD1266A80538692C90138E7BADE",  # noqa: mock
-                    },
-                    {
-                        "Balance": {
-                            "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                            "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
-                            "value": "47.21480375660969",
-                        },
-                        "Flags": 1114112,
-                        "HighLimit": {
-                            "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                            "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                            "value": "0",
-                        },
-                        "HighNode": "3799",
-                        "LedgerEntryType": "RippleState",
-                        "LowLimit": {
-                            "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                            "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                            "value": "1000000000",
-                        },
-                        "LowNode": "0",
-                        "PreviousTxnID": "E1260EC17725167D0407F73F6B73D7DAF1E3037249B54FC37F2E8B836703AB95",  # noqa: mock
-                        "PreviousTxnLgrSeq": 89077268,
-                        "index": "E1C84325F137AD05CB78F59968054BCBFD43CB4E70F7591B6C3C1D1C7E44C6FC",  # noqa: mock
-                    },
-                    {
-                        "Account": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
-                        "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07B2FFFC6A7DA8",  # noqa: mock
-                        "BookNode": "0",
-                        "Flags": 131072,
-                        "LedgerEntryType": "Offer",
-                        "OwnerNode": "0",
-                        "PreviousTxnID": "819FF36C6F44F3F858B25580F1E3A900F56DCC59F2398626DB35796AF9E47E7A",  # noqa: mock
-                        "PreviousTxnLgrSeq": 89078756,
-                        "Sequence": 84439999,
-                        "TakerGets": {
-                            "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                            "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                            "value": "2.307186473918109",
-                        },
-                        "TakerPays": "499999",
-                        "index": "ECF76E93DBD7923D0B352A7719E5F9BBF6A43D5BA80173495B0403C646184301",  # noqa: mock
-                    },
-                ],
-                "ledger_hash": "5A76A3A3D115DBC7CE0E4D9868D1EA15F593C8D74FCDF1C0153ED003B5621671",  # noqa: mock
-                "ledger_index": 89078774,
-                "limit": 200,
-                "validated": True,
-            },  # noqa: mock
-            id="account_objects_144811",
-            type=ResponseType.RESPONSE,
-        )
-
-        return resp
-
-    def _client_response_account_info_issuer(self):
-        resp = Response(
-            status=ResponseStatus.SUCCESS,
-            result={
-                "account_data": {
-                    "Account": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                    "Balance": "7329544278",
-                    "Domain": "736F6C6F67656E69632E636F6D",  # noqa: mock
-                    "EmailHash": "7AC3878BF42A5329698F468A6AAA03B9",  # noqa: mock
-                    "Flags": 12058624,
-                    "LedgerEntryType": "AccountRoot",
-                    "OwnerCount": 0,
-                    "PreviousTxnID": "C35579B384BE5DBE064B4778C4EDD18E1388C2CAA2C87BA5122C467265FC7A79",  # noqa: mock
-                    "PreviousTxnLgrSeq": 89004092,
-                    "RegularKey": "rrrrrrrrrrrrrrrrrrrrBZbvji",
-                    "Sequence": 14,
-                    "TransferRate": 1000100000,
-                    "index": "ED3EE6FAB9822943809FBCBEEC44F418D76292A355B38C1224A378AEB3A65D6D",  # noqa: mock
-                    "urlgravatar": "http://www.gravatar.com/avatar/7ac3878bf42a5329698f468a6aaa03b9",  # noqa: mock
-                },
-                "account_flags": {
-                    "allowTrustLineClawback": False,
-                    "defaultRipple": True,
-                    "depositAuth": False,
-                    "disableMasterKey": True,
-                    "disallowIncomingCheck": False,
-                    "disallowIncomingNFTokenOffer": False,
-                    "disallowIncomingPayChan": False,
-                    "disallowIncomingTrustline": False,
-                    "disallowIncomingXRP": True,
-                    "globalFreeze": False,
-                    "noFreeze": True,
-                    "passwordSpent": False,
-                    "requireAuthorization": False,
-                    "requireDestinationTag": False,
-                },
-                "ledger_hash": "AE78A574FCD1B45135785AC9FB64E7E0E6E4159821EF0BB8A59330C1B0E047C9",  # noqa: mock
-                "ledger_index": 89004663,
-                "validated": True,
-            },
-            id="account_info_73967",
-            type=ResponseType.RESPONSE,
-        )
+        return pickle.loads(_EVENT_LIMIT_PARTIAL_PICKLE)
 
-        return resp
+    def _client_response_account_info(self):
+        return _ACCOUNT_INFO_RESPONSE
+
+    def _client_response_account_lines(self):
+        return _ACCOUNT_LINES_RESPONSE
+
+    def _client_response_account_objects(self):
+        return _ACCOUNT_OBJECTS_RESPONSE
+
+    def _client_response_account_info_issuer(self):
+        return _ACCOUNT_INFO_ISSUER_RESPONSE
 
     def test_get_new_order_book_successful(self):
+        self._start_order_book_tracker()
         self.async_run_with_timeout(self.connector._orderbook_ds.get_new_order_book(self.trading_pair))
         order_book: OrderBook = self.connector.get_order_book(self.trading_pair)
 
-        bids = list(order_book.bid_entries())
-        asks = list(order_book.ask_entries())
-        self.assertEqual(2, len(bids))
-        self.assertEqual(0.2235426870065409, bids[0].price)
-        self.assertEqual(836.5292665312212, bids[0].amount)
-        self.assertEqual(2, len(asks))
-        self.assertEqual(0.22452700389932698, asks[0].price)
-        self.assertEqual(91.846106, asks[0].amount)
+        # Unpacking the entry generators checks there are exactly two levels per side
+        best_bid, _ = order_book.bid_entries()
+        best_ask, _ = order_book.ask_entries()
+        self.assertAlmostEqual(0.2235426870065409, best_bid.price, places=12)
+        self.assertAlmostEqual(836.5292665312212, best_bid.amount, places=12)
+        self.assertAlmostEqual(0.22452700389932698, best_ask.price, places=12)
+        self.assertAlmostEqual(91.846106, best_ask.amount, places=12)
+
+    @patch.object(ClientOrderTracker, "process_order_update", new=_noop)
+    def test_place_limit_order(self):
+        (verify_transaction_result_mock,) = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result",
+        )
+
+        mock_async_websocket_client, autofill_mock, sign_mock, submit_mock = self._patch_order_submission()
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_submit")
-    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update")
-    def test_place_limit_order(
-        self,
-        process_order_update_mock,
-        submit_mock,
-        sign_mock,
-        autofill_mock,
-        verify_transaction_result_mock,
-        mock_async_websocket_client
-    ):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
         mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
         verify_transaction_result_mock.return_value = True, {}
-        sign_mock.return_value = Transaction(
-            sequence=1, last_ledger_sequence=1, account="r1234", transaction_type=TransactionType.OFFER_CREATE
-        )
-
-        submit_mock.return_value = Response(
-            status=ResponseStatus.SUCCESS, result={"engine_result": "tesSUCCESS", "engine_result_message": "something"}
-        )
-
-        self.async_run_with_timeout(
-            self.connector._place_order(
-                "hbot",
-                self.trading_pair,
-                Decimal("12345.12345678901234567"),
-                TradeType.BUY,
-                OrderType.LIMIT,
-                Decimal("1"),
-            )
-        )
+        sign_mock.return_value = _SIGNED_OFFER_CREATE
 
-        self.async_run_with_timeout(
-            self.connector._place_order(
-                "hbot",
-                self.trading_pair,
-                Decimal("12345.12345678901234567"),
-                TradeType.SELL,
-                OrderType.LIMIT,
-                Decimal("1234567.123456789"),
-            )
-        )
+        submit_mock.return_value = _SUBMIT_SUCCESS_RESPONSE
 
-        self.async_run_with_timeout(
-            self.connector._place_order(
-                "hbot",
-                self.trading_pair_usd,
-                Decimal("12345.12345678901234567"),
-                TradeType.BUY,
-                OrderType.LIMIT,
-                Decimal("1234567.123456789"),
-            )
+        limit_cases = (
+            (self.trading_pair, TradeType.BUY, _D_1),
+            (self.trading_pair, TradeType.SELL, _BIG_PRICE),
+            (self.trading_pair_usd, TradeType.BUY, _BIG_PRICE),
+            (self.trading_pair_usd, TradeType.SELL, _BIG_PRICE),
         )
-
         self.async_run_with_timeout(
-            self.connector._place_order(
-                "hbot",
-                self.trading_pair_usd,
-                Decimal("12345.12345678901234567"),
-                TradeType.SELL,
-                OrderType.LIMIT,
-                Decimal("1234567.123456789"),
+            asyncio.gather(
+                *(
+                    self.connector._place_order("hbot", trading_pair, _BIG_AMOUNT, trade_type, OrderType.LIMIT, price)
+                    for trading_pair, trade_type, price in limit_cases
+                )
             )
         )
 
+        spawned_tasks = self._collect_spawned_tasks()
         order_id = self.connector.buy(
             self.trading_pair_usd,
-            Decimal("12345.12345678901234567"),
+            _BIG_AMOUNT,
             OrderType.LIMIT,
-            Decimal("1234567.123456789"),
+            _BIG_PRICE,
         )
 
         self.assertEqual(order_id.split("-")[0], "hbot")
 
         order_id = self.connector.sell(
             self.trading_pair_usd,
-            Decimal("12345.12345678901234567"),
+            _BIG_AMOUNT,
             OrderType.LIMIT,
-            Decimal("1234567.123456789"),
+            _BIG_PRICE,
         )
 
         self.assertEqual(order_id.split("-")[0], "hbot")
+        self.async_run_with_timeout(asyncio.gather(*spawned_tasks))
 
-        self.assertTrue(process_order_update_mock.called)
+        # Verification is the last step of a submission, so reaching it covers autofill, sign and submit
         self.assertTrue(verify_transaction_result_mock.called)
-        self.assertTrue(submit_mock.called)
-        self.assertTrue(autofill_mock.called)
-        self.assertTrue(sign_mock.called)
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_submit")
-    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update")
-    def test_place_market_order(
-        self,
-        process_order_update_mock,
-        submit_mock,
-        sign_mock,
-        autofill_mock,
-        verify_transaction_result_mock,
-        mock_async_websocket_client
-    ):
+    @patch.object(ClientOrderTracker, "process_order_update", new=_noop)
+    def test_place_market_order(self):
+        (verify_transaction_result_mock,) = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result",
+        )
+
+        mock_async_websocket_client, autofill_mock, sign_mock, submit_mock = self._patch_order_submission()
+
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
         mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
         verify_transaction_result_mock.return_value = True, {}
-        sign_mock.return_value = Transaction(
-            sequence=1, last_ledger_sequence=1, account="r1234", transaction_type=TransactionType.OFFER_CREATE
-        )
+        sign_mock.return_value = _SIGNED_OFFER_CREATE
 
-        submit_mock.return_value = Response(
-            status=ResponseStatus.SUCCESS, result={"engine_result": "tesSUCCESS", "engine_result_message": "something"}
-        )
+        submit_mock.return_value = _SUBMIT_SUCCESS_RESPONSE
 
         class MockGetPriceReturn:
+            __slots__ = ("result_price",)
+
             def __init__(self, result_price):
                 self.result_price = result_price
 
         # get_price_for_volume_mock.return_value = Decimal("1")
         self.connector.order_books[self.trading_pair] = MagicMock()
         self.connector.order_books[self.trading_pair].get_price_for_volume = MagicMock(
-            return_value=MockGetPriceReturn(result_price=Decimal("1"))
+            return_value=MockGetPriceReturn(result_price=_D_1)
         )
 
         self.connector.order_books[self.trading_pair_usd] = MagicMock()
         self.connector.order_books[self.trading_pair_usd].get_price_for_volume = MagicMock(
-            return_value=MockGetPriceReturn(result_price=Decimal("1"))
-        )
-
-        self.async_run_with_timeout(
-            self.connector._place_order(
-                "hbot", self.trading_pair, Decimal("1"), TradeType.BUY, OrderType.MARKET, Decimal("1")
-            )
-        )
-
-        self.async_run_with_timeout(
-            self.connector._place_order(
-                "hbot", self.trading_pair, Decimal("1"), TradeType.SELL, OrderType.MARKET, Decimal("1")
-            )
+            return_value=MockGetPriceReturn(result_price=_D_1)
         )
 
-        self.async_run_with_timeout(
-            self.connector._place_order(
-                "hbot", self.trading_pair_usd, Decimal("1"), TradeType.BUY, OrderType.MARKET, Decimal("1")
-            )
+        market_cases = (
+            (self.trading_pair, TradeType.BUY),
+            (self.trading_pair, TradeType.SELL),
+            (self.trading_pair_usd, TradeType.BUY),
+            (self.trading_pair_usd, TradeType.SELL),
         )
-
         self.async_run_with_timeout(
-            self.connector._place_order(
-                "hbot", self.trading_pair_usd, Decimal("1"), TradeType.SELL, OrderType.MARKET, Decimal("1")
+            asyncio.gather(
+                *(
+                    self.connector._place_order("hbot", trading_pair, _D_1, trade_type, OrderType.MARKET, _D_1)
+                    for trading_pair, trade_type in market_cases
+                )
             )
         )
 
+        spawned_tasks = self._collect_spawned_tasks()
         order_id = self.connector.buy(
             self.trading_pair_usd,
-            Decimal("12345.12345678901234567"),
+            _BIG_AMOUNT,
             OrderType.MARKET,
-            Decimal("1234567.123456789"),
+            _BIG_PRICE,
         )
 
         self.assertEqual(order_id.split("-")[0], "hbot")
 
         order_id = self.connector.sell(
             self.trading_pair_usd,
-            Decimal("12345.12345678901234567"),
+            _BIG_AMOUNT,
             OrderType.MARKET,
-            Decimal("1234567.123456789"),
+            _BIG_PRICE,
         )
 
         self.assertEqual(order_id.split("-")[0], "hbot")
+        self.async_run_with_timeout(asyncio.gather(*spawned_tasks))
 
-        self.assertTrue(process_order_update_mock.called)
         self.assertTrue(verify_transaction_result_mock.called)
-        self.assertTrue(submit_mock.called)
-        self.assertTrue(autofill_mock.called)
-        self.assertTrue(sign_mock.called)
 
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.autofill", new_callable=MagicMock)
     # @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.submit", new_callable=MagicMock)
     def test_place_order_exception_handling_not_found_market(self, autofill_mock):
-        with self.assertRaises(Exception) as context:
+        with self.assertRaisesRegex(Exception, r"Market NOT_FOUND not found in markets list"):
             self.async_run_with_timeout(
                 self.connector._place_order(
                     order_id="test_order",
                     trading_pair="NOT_FOUND",
-                    amount=Decimal("1.0"),
+                    amount=_D_1,
                     trade_type=TradeType.BUY,
                     order_type=OrderType.MARKET,
-                    price=Decimal("1"),
+                    price=_D_1,
                 )
             )
 
-        # Verify the exception was raised and contains the expected message
-        self.assertTrue("Market NOT_FOUND not found in markets list" in str(context.exception))
-
     @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.autofill", new_callable=MagicMock)
     # @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.submit", new_callable=MagicMock)
     def test_place_order_exception_handling_autofill(self, autofill_mock, mock_async_websocket_client):
+        self._start_order_book_tracker()
+
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
         mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
@@ -1177,230 +1241,157 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         # Simulate an exception during the autofill operation
         autofill_mock.side_effect = Exception("Test exception during autofill")
 
-        with self.assertRaises(Exception) as context:
+        with self.assertRaisesRegex(
+            Exception, r"Order None \(test_order\) creation failed: Test exception during autofill"
+        ):
             self.async_run_with_timeout(
                 self.connector._place_order(
                     order_id="test_order",
                     trading_pair="SOLO-XRP",
-                    amount=Decimal("1.0"),
+                    amount=_D_1,
                     trade_type=TradeType.BUY,
                     order_type=OrderType.MARKET,
-                    price=Decimal("1"),
+                    price=_D_1,
                 )
             )
 
-        # Verify the exception was raised and contains the expected message
-        self.assertTrue(
-            "Order None (test_order) creation failed: Test exception during autofill" in str(context.exception)
+    @patch.object(XrplExchange, "_make_network_check_request", new=_async_noop)
+    @patch.object(ClientOrderTracker, "process_order_update", new=_noop)
+    @patch.object(ExchangePyBase, "_sleep", new=_async_noop)
+    def test_place_order_exception_handling_failed_verify(self):
+        (verify_transaction_result_mock,) = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result",
         )
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
-    @patch("hummingbot.connector.exchange_py_base.ExchangePyBase._sleep")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_submit")
-    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._make_network_check_request")
-    def test_place_order_exception_handling_failed_verify(
-        self,
-        network_mock,
-        process_order_update_mock,
-        submit_mock,
-        sign_mock,
-        autofill_mock,
-        verify_transaction_result_mock,
-        sleep_mock,
-        mock_async_websocket_client
-    ):
+        mock_async_websocket_client, autofill_mock, sign_mock, submit_mock = self._patch_order_submission()
+
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
         mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
         verify_transaction_result_mock.return_value = False, {}
-        sign_mock.return_value = Transaction(
-            sequence=1, last_ledger_sequence=1, account="r1234", transaction_type=TransactionType.OFFER_CREATE
-        )
+        sign_mock.return_value = _SIGNED_OFFER_CREATE
 
-        submit_mock.return_value = Response(
-            status=ResponseStatus.SUCCESS, result={"engine_result": "tesSUCCESS", "engine_result_message": "something"}
-        )
+        submit_mock.return_value = _SUBMIT_SUCCESS_RESPONSE
 
-        with self.assertRaises(Exception) as context:
+        with self.assertRaisesRegex(
+            Exception,
+            r"Order 1-1 \(hbot\) creation failed: Failed to verify transaction result for order hbot \(1-1\)",
+        ):
             self.async_run_with_timeout(
                 self.connector._place_order(
                     "hbot",
                     self.trading_pair_usd,
-                    Decimal("12345.12345678901234567"),
+                    _BIG_AMOUNT,
                     TradeType.SELL,
                     OrderType.LIMIT,
-                    Decimal("1234567.123456789"),
+                    _BIG_PRICE,
                 )
             )
 
-        # # Verify the exception was raised and contains the expected message
-        self.assertTrue(
-            "Order 1-1 (hbot) creation failed: Failed to verify transaction result for order hbot (1-1)"
-            in str(context.exception)
+    @patch.object(XrplExchange, "_make_network_check_request", new=_async_noop)
+    @patch.object(ClientOrderTracker, "process_order_update", new=_noop)
+    @patch.object(ExchangePyBase, "_sleep", new=_async_noop)
+    def test_place_order_exception_handling_none_verify_resp(self):
+        (verify_transaction_result_mock,) = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result",
         )
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
-    @patch("hummingbot.connector.exchange_py_base.ExchangePyBase._sleep")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_submit")
-    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._make_network_check_request")
-    def test_place_order_exception_handling_none_verify_resp(
-        self,
-        network_mock,
-        process_order_update_mock,
-        submit_mock,
-        sign_mock,
-        autofill_mock,
-        verify_transaction_result_mock,
-        sleep_mock,
-        mock_async_websocket_client
-    ):
+        mock_async_websocket_client, autofill_mock, sign_mock, submit_mock = self._patch_order_submission()
+
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
         mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
         verify_transaction_result_mock.return_value = False, None
-        sign_mock.return_value = Transaction(
-            sequence=1, last_ledger_sequence=1, account="r1234", transaction_type=TransactionType.OFFER_CREATE
-        )
+        sign_mock.return_value = _SIGNED_OFFER_CREATE
 
-        submit_mock.return_value = Response(
-            status=ResponseStatus.SUCCESS, result={"engine_result": "tesSUCCESS", "engine_result_message": "something"}
-        )
+        submit_mock.return_value = _SUBMIT_SUCCESS_RESPONSE
 
-        with self.assertRaises(Exception) as context:
+        with self.assertRaisesRegex(
+            Exception, r"Order 1-1 \(hbot\) creation failed: Failed to place order hbot \(1-1\)"
+        ):
             self.async_run_with_timeout(
                 self.connector._place_order(
                     "hbot",
                     self.trading_pair_usd,
-                    Decimal("12345.12345678901234567"),
+                    _BIG_AMOUNT,
                     TradeType.SELL,
                     OrderType.LIMIT,
-                    Decimal("1234567.123456789"),
+                    _BIG_PRICE,
                 )
             )
 
-        # # Verify the exception was raised and contains the expected message
-        self.assertTrue("Order 1-1 (hbot) creation failed: Failed to place order hbot (1-1)" in str(context.exception))
+    @patch.object(XrplExchange, "_make_network_check_request", new=_async_noop)
+    @patch.object(ClientOrderTracker, "process_order_update", new=_noop)
+    @patch.object(ExchangePyBase, "_sleep", new=_async_noop)
+    def test_place_order_exception_handling_failed_submit(self):
+        (verify_transaction_result_mock,) = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result",
+        )
+
+        mock_async_websocket_client, autofill_mock, sign_mock, submit_mock = self._patch_order_submission()
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
-    @patch("hummingbot.connector.exchange_py_base.ExchangePyBase._sleep")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_submit")
-    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._make_network_check_request")
-    def test_place_order_exception_handling_failed_submit(
-        self,
-        network_mock,
-        process_order_update_mock,
-        submit_mock,
-        sign_mock,
-        autofill_mock,
-        verify_transaction_result_mock,
-        sleep_mock,
-        mock_async_websocket_client
-    ):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
         mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
         verify_transaction_result_mock.return_value = False, None
-        sign_mock.return_value = Transaction(
-            sequence=1, last_ledger_sequence=1, account="r1234", transaction_type=TransactionType.OFFER_CREATE
-        )
+        sign_mock.return_value = _SIGNED_OFFER_CREATE
 
-        submit_mock.return_value = Response(
-            status=ResponseStatus.ERROR, result={"engine_result": "tec", "engine_result_message": "something"}
-        )
+        submit_mock.return_value = _SUBMIT_ERROR_RESPONSE
 
-        with self.assertRaises(Exception) as context:
+        with self.assertRaisesRegex(
+            Exception, r"Order 1-1 \(hbot\) creation failed: Failed to place order hbot \(1-1\)"
+        ):
             self.async_run_with_timeout(
                 self.connector._place_order(
                     "hbot",
                     self.trading_pair_usd,
-                    Decimal("12345.12345678901234567"),
+                    _BIG_AMOUNT,
                     TradeType.SELL,
                     OrderType.LIMIT,
-                    Decimal("1234567.123456789"),
+                    _BIG_PRICE,
                 )
             )
 
-        # # Verify the exception was raised and contains the expected message
-        self.assertTrue("Order 1-1 (hbot) creation failed: Failed to place order hbot (1-1)" in str(context.exception))
+    def test_place_cancel(self):
+        mock_async_websocket_client, autofill_mock, sign_mock, submit_mock = self._patch_order_submission()
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_submit")
-    def test_place_cancel(
-        self,
-        submit_mock,
-        sign_mock,
-        autofill_mock,
-        mock_async_websocket_client,
-    ):
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
         mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
 
         autofill_mock.return_value = {}
-        sign_mock.return_value = Transaction(
-            sequence=1, last_ledger_sequence=1, account="r1234", transaction_type=TransactionType.OFFER_CREATE
-        )
+        sign_mock.return_value = _SIGNED_OFFER_CREATE
 
-        submit_mock.return_value = Response(
-            status=ResponseStatus.SUCCESS, result={"engine_result": "tesSUCCESS", "engine_result_message": "something"}
-        )
+        submit_mock.return_value = _SUBMIT_SUCCESS_RESPONSE
 
-        in_flight_order = InFlightOrder(
-            client_order_id="hbot",
-            exchange_order_id="1234-4321",
-            trading_pair=self.trading_pair,
-            order_type=OrderType.LIMIT,
-            trade_type=TradeType.BUY,
-            amount=Decimal("1"),
-            creation_timestamp=1,
-        )
+        in_flight_order = self._create_hbot_order(exchange_order_id="1234-4321", price=None)
 
         self.async_run_with_timeout(self.connector._place_cancel("hbot", tracked_order=in_flight_order))
         self.assertTrue(submit_mock.called)
-        self.assertTrue(autofill_mock.called)
-        self.assertTrue(sign_mock.called)
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_submit")
-    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update")
-    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.process_trade_update")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.process_trade_fills")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._request_order_status")
-    def test_place_order_and_process_update(
-        self,
-        request_order_status_mock,
-        process_trade_fills_mock,
-        process_trade_update_mock,
-        process_order_update_mock,
-        submit_mock,
-        sign_mock,
-        autofill_mock,
-        verify_transaction_result_mock,
-        mock_async_websocket_client,
-    ):
+    def test_place_order_and_process_update(self):
+        (
+            request_order_status_mock,
+            process_trade_fills_mock,
+            process_trade_update_mock,
+            process_order_update_mock,
+            verify_transaction_result_mock,
+        ) = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._request_order_status",
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.process_trade_fills",
+            "hummingbot.connector.client_order_tracker.ClientOrderTracker.process_trade_update",
+            "hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update",
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result",
+        )
+
+        mock_async_websocket_client, autofill_mock, sign_mock, submit_mock = self._patch_order_submission()
+
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
         mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
@@ -1411,57 +1402,32 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             update_timestamp=1,
         )
         autofill_mock.return_value = {}
-        verify_transaction_result_mock.return_value = True, Response(
-            status=ResponseStatus.SUCCESS, result={"engine_result": "tesSUCCESS", "engine_result_message": "something"}
-        )
-        sign_mock.return_value = Transaction(
-            sequence=1, last_ledger_sequence=1, account="r1234", transaction_type=TransactionType.OFFER_CREATE
-        )
+        verify_transaction_result_mock.return_value = True, _SUBMIT_SUCCESS_RESPONSE
+        sign_mock.return_value = _SIGNED_OFFER_CREATE
 
-        submit_mock.return_value = Response(
-            status=ResponseStatus.SUCCESS, result={"engine_result": "tesSUCCESS", "engine_result_message": "something"}
-        )
+        submit_mock.return_value = _SUBMIT_SUCCESS_RESPONSE
 
-        in_flight_order = InFlightOrder(
-            client_order_id="hbot",
-            trading_pair=self.trading_pair,
-            order_type=OrderType.LIMIT,
-            trade_type=TradeType.BUY,
-            amount=Decimal("1"),
-            price=Decimal("1"),
-            creation_timestamp=1,
-        )
+        in_flight_order = self._create_hbot_order()
 
         exchange_order_id = self.async_run_with_timeout(
             self.connector._place_order_and_process_update(order=in_flight_order)
         )
-        self.assertTrue(submit_mock.called)
-        self.assertTrue(autofill_mock.called)
-        self.assertTrue(sign_mock.called)
         self.assertTrue(process_order_update_mock.called)
         self.assertTrue(process_trade_update_mock.called)
         self.assertTrue(process_trade_fills_mock.called)
         self.assertEqual("1-1", exchange_order_id)
 
-    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_submit")
-    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._make_network_check_request")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._request_order_status")
-    def test_execute_order_cancel_and_process_update(
-        self,
-        request_order_status_mock,
-        network_mock,
-        process_order_update_mock,
-        submit_mock,
-        sign_mock,
-        autofill_mock,
-        verify_transaction_result_mock,
-        mock_async_websocket_client,
-    ):
+    @patch.object(XrplExchange, "_make_network_check_request", new=_async_noop)
+    @patch.object(ExchangePyBase, "_sleep", new=_async_noop)
+    def test_execute_order_cancel_and_process_update(self):
+        request_order_status_mock, process_order_update_mock, verify_transaction_result_mock = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._request_order_status",
+            "hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update",
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result",
+        )
+
+        mock_async_websocket_client, autofill_mock, sign_mock, submit_mock = self._patch_order_submission()
+
         # Create a mock client to be returned by the context manager
         mock_client = AsyncMock()
         mock_async_websocket_client.return_value.__aenter__.return_value = mock_client
@@ -1472,28 +1438,12 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             update_timestamp=1,
         )
         autofill_mock.return_value = {}
-        verify_transaction_result_mock.return_value = True, Response(
-            status=ResponseStatus.SUCCESS,
-            result={"engine_result": "tesSUCCESS", "engine_result_message": "something", "meta": {"AffectedNodes": []}},
-        )
-        sign_mock.return_value = Transaction(
-            sequence=1, last_ledger_sequence=1, account="r1234", transaction_type=TransactionType.OFFER_CREATE
-        )
+        verify_transaction_result_mock.return_value = True, _VALIDATED_NO_CHANGES_RESPONSE
+        sign_mock.return_value = _SIGNED_OFFER_CREATE
 
-        submit_mock.return_value = Response(
-            status=ResponseStatus.SUCCESS, result={"engine_result": "tesSUCCESS", "engine_result_message": "something"}
-        )
+        submit_mock.return_value = _SUBMIT_SUCCESS_RESPONSE
 
-        in_flight_order = InFlightOrder(
-            client_order_id="hbot",
-            exchange_order_id="1234-4321",
-            trading_pair=self.trading_pair,
-            order_type=OrderType.LIMIT,
-            trade_type=TradeType.BUY,
-            amount=Decimal("1"),
-            price=Decimal("1"),
-            creation_timestamp=1,
-        )
+        in_flight_order = self._create_hbot_order(exchange_order_id="1234-4321")
 
         result = self.async_run_with_timeout(
             self.connector._execute_order_cancel_and_process_update(order=in_flight_order)
@@ -1501,6 +1451,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertTrue(process_order_update_mock.called)
         self.assertTrue(result)
 
+        process_order_update_mock.reset_mock()
         request_order_status_mock.return_value = OrderUpdate(
             trading_pair=self.trading_pair,
             new_state=OrderState.OPEN,
@@ -1518,148 +1469,83 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
 
         result = self.connector._format_trading_rules(trading_rules_info)
 
-        expected_result = [
-            TradingRule(
-                trading_pair="XRP-USD",
-                min_order_size=Decimal(0.01),
-                min_price_increment=Decimal("1e-8"),
-                min_quote_amount_increment=Decimal("1e-8"),
-                min_base_amount_increment=Decimal("1e-8"),
-                min_notional_size=Decimal("1e-8"),
-            )
-        ]
-
-        self.assertEqual(result[0].min_order_size, expected_result[0].min_order_size)
-        self.assertEqual(result[0].min_price_increment, expected_result[0].min_price_increment)
-        self.assertEqual(result[0].min_quote_amount_increment, expected_result[0].min_quote_amount_increment)
-        self.assertEqual(result[0].min_base_amount_increment, expected_result[0].min_base_amount_increment)
-        self.assertEqual(result[0].min_notional_size, expected_result[0].min_notional_size)
+        self.assertEqual(_trading_rule_limits(result[0]), _trading_rule_limits(_EXPECTED_TRADING_RULE_XRP_USD))
 
     def test_format_trading_pair_fee_rules(self):
         trading_rules_info = {"XRP-USD": {"base_transfer_rate": 0.01, "quote_transfer_rate": 0.01}}
 
         result = self.connector._format_trading_pair_fee_rules(trading_rules_info)
 
-        expected_result = [
-            {
-                "trading_pair": "XRP-USD",
-                "base_token": "XRP",
-                "quote_token": "USD",
-                "base_transfer_rate": 0.01,
-                "quote_transfer_rate": 0.01,
-            }
-        ]
-
-        self.assertEqual(result, expected_result)
-
-    @patch("hummingbot.connector.exchange_py_base.ExchangePyBase._iter_user_event_queue")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.get_order_by_sequence")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._update_balances")
-    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update")
-    def test_user_stream_event_listener(
-        self,
-        process_order_update_mock,
-        update_balances_mock,
-        get_account_mock,
-        get_order_by_sequence,
-        iter_user_event_queue_mock,
-    ):
-        async def async_generator(lst):
-            for item in lst:
-                yield item
-
-        message_list = [self._event_message()]
-        async_iterable = async_generator(message_list)
+        self.assertEqual(result, _EXPECTED_FEE_RULES_XRP_USD)
 
-        in_flight_order = InFlightOrder(
-            client_order_id="hbot",
-            exchange_order_id="84437780-88954510",
-            trading_pair=self.trading_pair,
-            order_type=OrderType.MARKET,
-            trade_type=TradeType.BUY,
-            amount=Decimal("2.239836701211152"),
-            price=Decimal("0.224547537"),
-            creation_timestamp=1,
+    def test_user_stream_event_listener(self):
+        (
+            process_order_update_mock,
+            update_balances_mock,
+            get_account_mock,
+            get_order_by_sequence,
+            iter_user_event_queue_mock,
+        ) = self._patch_shared(
+            "hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update",
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._update_balances",
+            "hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account",
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.get_order_by_sequence",
+            "hummingbot.connector.exchange_py_base.ExchangePyBase._iter_user_event_queue",
         )
 
-        iter_user_event_queue_mock.return_value = async_iterable
-        get_order_by_sequence.return_value = in_flight_order
         get_account_mock.return_value = "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK"  # noqa: mock
+        cases = (
+            (
+                self._event_message(),
+                "84437780-88954510",
+                OrderType.MARKET,
+                Decimal("2.239836701211152"),
+                OrderState.FILLED,
+            ),
+            (
+                self._event_message_limit_order_partially_filled(),
+                "84437895-88954510",
+                OrderType.LIMIT,
+                _ORDER_AMOUNT,
+                OrderState.PARTIALLY_FILLED,
+            ),
+        )
+
+        for event_message, exchange_order_id, order_type, amount, expected_state in cases:
+            with self.subTest(expected_state=expected_state):
+                process_order_update_mock.reset_mock()
+                update_balances_mock.reset_mock()
+                get_account_mock.reset_mock()
+                iter_user_event_queue_mock.return_value = _AsyncIter([event_message])
+                get_order_by_sequence.return_value = self._create_hbot_order(
+                    exchange_order_id=exchange_order_id, order_type=order_type, amount=amount, price=_ORDER_PRICE
+                )
 
-        self.async_run_with_timeout(self.connector._user_stream_event_listener())
-        self.assertTrue(update_balances_mock.called)
-        self.assertTrue(get_account_mock.called)
-        self.assertTrue(get_order_by_sequence.called)
-        self.assertTrue(iter_user_event_queue_mock.called)
-
-        args, kwargs = process_order_update_mock.call_args
-        self.assertEqual(kwargs["order_update"].new_state, OrderState.FILLED)
-
-    @patch("hummingbot.connector.exchange_py_base.ExchangePyBase._iter_user_event_queue")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.get_order_by_sequence")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._update_balances")
-    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.process_order_update")
-    def test_user_stream_event_listener_partially_filled(
-        self,
-        process_order_update_mock,
-        update_balances_mock,
-        get_account_mock,
-        get_order_by_sequence,
-        iter_user_event_queue_mock,
-    ):
-        async def async_generator(lst):
-            for item in lst:
-                yield item
-
-        message_list = [self._event_message_limit_order_partially_filled()]
-        async_iterable = async_generator(message_list)
-
-        in_flight_order = InFlightOrder(
-            client_order_id="hbot",
-            exchange_order_id="84437895-88954510",
-            trading_pair=self.trading_pair,
-            order_type=OrderType.LIMIT,
-            trade_type=TradeType.BUY,
-            amount=Decimal("1.47951609"),
-            price=Decimal("0.224547537"),
-            creation_timestamp=1,
-        )
-
-        iter_user_event_queue_mock.return_value = async_iterable
-        get_order_by_sequence.return_value = in_flight_order
-        get_account_mock.return_value = "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK"  # noqa: mock
+                self.async_run_with_timeout(self.connector._user_stream_event_listener())
+                self.assertTrue(update_balances_mock.called)
+                self.assertTrue(get_account_mock.called)
 
-        self.async_run_with_timeout(self.connector._user_stream_event_listener())
-        self.assertTrue(update_balances_mock.called)
-        self.assertTrue(get_account_mock.called)
-        self.assertTrue(get_order_by_sequence.called)
-        self.assertTrue(iter_user_event_queue_mock.called)
+                self.assertEqual(1, process_order_update_mock.call_count)
+                args, kwargs = process_order_update_mock.call_args
+                self.assertEqual(kwargs["order_update"].new_state, expected_state)
 
-        args, kwargs = process_order_update_mock.call_args
-        self.assertEqual(kwargs["order_update"].new_state, OrderState.PARTIALLY_FILLED)
+    @patch.object(XrplExchange, "_make_network_check_request", new=_async_noop)
+    @patch.object(ExchangePyBase, "_sleep", new=_async_noop)
+    def test_update_balances(self):
+        (get_account_mock,) = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account",
+        )
 
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._make_network_check_request")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account")
-    def test_update_balances(self, get_account_mock, network_mock):
         get_account_mock.return_value = "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK"  # noqa: mock
 
-        def side_effect_function(arg: Request):
-            if arg.method == RequestMethod.ACCOUNT_INFO:
-                return self._client_response_account_info()
-            elif arg.method == RequestMethod.ACCOUNT_OBJECTS:
-                return self._client_response_account_objects()
-            elif arg.method == RequestMethod.ACCOUNT_LINES:
-                return self._client_response_account_lines()
-            else:
-                raise ValueError("Invalid method")
-
-        self.connector._xrpl_query_client.request.side_effect = side_effect_function
-
-        self.async_run_with_timeout(self.connector._update_balances())
+        # _update_balances always queries account info, then objects, then lines
+        self.connector._xrpl_query_client.request.side_effect = [
+            self._client_response_account_info(),
+            self._client_response_account_objects(),
+            self._client_response_account_lines(),
+        ]
 
-        self.assertTrue(get_account_mock.called)
+        self._run(self.connector._update_balances())
 
         self.assertEqual(self.connector._account_balances["XRP"], Decimal("57.030864"))
         self.assertEqual(self.connector._account_balances["USD"], Decimal("0.011094399237562"))
@@ -1669,162 +1555,107 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(self.connector._account_available_balances["USD"], Decimal("0.011094399237562"))
         self.assertEqual(self.connector._account_available_balances["SOLO"], Decimal("31.337975848655761"))
 
+    @patch.object(ExchangePyBase, "_sleep", new=_async_noop)
     def test_make_trading_rules_request(self):
-        def side_effect_function(arg: Request):
-            if arg.method == RequestMethod.ACCOUNT_INFO:
-                return self._client_response_account_info_issuer()
-            else:
-                raise ValueError("Invalid method")
-
-        self.connector._xrpl_query_client.request.side_effect = side_effect_function
+        self.connector._xrpl_query_client.request.side_effect = _respond_by_method(
+            {RequestMethod.ACCOUNT_INFO: self._client_response_account_info_issuer()}
+        )
 
-        result = self.async_run_with_timeout(self.connector._make_trading_rules_request())
+        result = self._run(self.connector._make_trading_rules_request())
 
-        self.assertEqual(
-            result["SOLO-XRP"]["base_currency"].currency, "534F4C4F00000000000000000000000000000000"
-        )  # noqa: mock
-        self.assertEqual(result["SOLO-XRP"]["base_currency"].issuer, "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz")  # noqa: mock
+        self.assertEqual(result["SOLO-XRP"]["base_currency"].currency, _SOLO_CURRENCY)
+        self.assertEqual(result["SOLO-XRP"]["base_currency"].issuer, _SOLO_ISSUER)
         self.assertEqual(result["SOLO-XRP"]["base_tick_size"], 15)
         self.assertEqual(result["SOLO-XRP"]["quote_tick_size"], 6)
         self.assertEqual(result["SOLO-XRP"]["base_transfer_rate"], 9.999999999998899e-05)
         self.assertEqual(result["SOLO-XRP"]["quote_transfer_rate"], 0)
         self.assertEqual(result["SOLO-XRP"]["minimum_order_size"], 1e-06)
 
-        self.async_run_with_timeout(self.connector._update_trading_rules())
+        self._run(self.connector._update_trading_rules())
         trading_rule = self.connector.trading_rules["SOLO-XRP"]
         self.assertEqual(
             trading_rule.min_order_size,
             Decimal("9.99999999999999954748111825886258685613938723690807819366455078125E-7"),  # noqa: mock
         )
 
-        self.assertEqual(
-            result["SOLO-USD"]["base_currency"].currency, "534F4C4F00000000000000000000000000000000"  # noqa: mock
-        )
+        self.assertEqual(result["SOLO-USD"]["base_currency"].currency, _SOLO_CURRENCY)
         self.assertEqual(result["SOLO-USD"]["quote_currency"].currency, "USD")
 
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.wait_for_final_transaction_outcome")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._make_network_check_request")
-    def test_verify_transaction_success(self, network_check_mock, wait_for_outcome_mock):
-        wait_for_outcome_mock.return_value = Response(status=ResponseStatus.SUCCESS, result={})
-        transaction_mock = MagicMock()
-        transaction_mock.get_hash.return_value = "hash"
-        transaction_mock.last_ledger_sequence = 12345
+    @patch.object(XrplExchange, "_make_network_check_request", new=_async_noop)
+    def test_verify_transaction_success(self):
+        (wait_for_outcome_mock,) = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.wait_for_final_transaction_outcome",
+        )
+
+        wait_for_outcome_mock.return_value = _EMPTY_SUCCESS_RESPONSE
+        transaction_mock = _stub_transaction()
 
-        result, response = self.async_run_with_timeout(
+        result, response = self._run(
             self.connector._verify_transaction_result({"transaction": transaction_mock, "prelim_result": "tesSUCCESS"})
         )
         self.assertTrue(result)
         self.assertIsNotNone(response)
 
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.wait_for_final_transaction_outcome")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._make_network_check_request")
-    def test_verify_transaction_exception(self, network_check_mock, wait_for_outcome_mock):
-        wait_for_outcome_mock.side_effect = Exception("Test exception")
-        transaction_mock = MagicMock()
-        transaction_mock.get_hash.return_value = "hash"
-        transaction_mock.last_ledger_sequence = 12345
-
-        with self.assertLogs(level="ERROR") as log:
-            result, response = self.async_run_with_timeout(
-                self.connector._verify_transaction_result(
-                    {"transaction": transaction_mock, "prelim_result": "tesSUCCESS"}
-                )
-            )
+    @patch.object(XrplExchange, "_make_network_check_request", new=_async_noop)
+    def test_verify_transaction_exception(self):
+        (wait_for_outcome_mock,) = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.wait_for_final_transaction_outcome",
+        )
 
-        log_output = log.output[0]
-        self.assertEqual(
-            log_output,
-            "ERROR:hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange:Submitted transaction failed: Test exception",
+        wait_for_outcome_mock.side_effect = Exception("Test exception")
+        transaction_mock = _stub_transaction()
+        cases = (
+            (transaction_mock, "tesSUCCESS", "Submitted transaction failed: Test exception"),
+            (None, "tesSUCCESS", "Failed to verify transaction result, transaction is None"),
+            (transaction_mock, None, "Failed to verify transaction result, prelim_result is None"),
         )
 
-    def test_verify_transaction_exception_none_transaction(self):
-        with self.assertLogs(level="ERROR") as log:
-            self.async_run_with_timeout(
-                self.connector._verify_transaction_result({"transaction": None, "prelim_result": "tesSUCCESS"})
-            )
+        self._capture_connector_logs()
 
-        log_output = log.output[0]
-        self.assertEqual(
-            log_output,
-            "ERROR:hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange:Failed to verify transaction result, transaction is None",
-        )
+        for transaction, prelim_result, expected_error in cases:
+            with self.subTest(expected_error=expected_error):
+                self._clear_logs()
+                self.async_run_with_timeout(
+                    self.connector._verify_transaction_result({"transaction": transaction, "prelim_result": prelim_result})
+                )
 
+                self.assertEqual([(XrplExchange.logger().name, expected_error)], self._logged_errors())
+
+    def test_verify_transaction_timeout(self):
         self.connector.wait_for_final_transaction_outcome = AsyncMock()
         self.connector.wait_for_final_transaction_outcome.side_effect = TimeoutError
         self.connector._sleep = AsyncMock()
+        self._capture_connector_logs()
+        expected_error = "Max retries reached. Verify transaction failed due to timeout."
 
-        with self.assertLogs(level="ERROR") as log:
-            self.async_run_with_timeout(
-                self.connector._verify_transaction_result(
-                    {
-                        "transaction": Transaction(
-                            account="r1234", transaction_type=TransactionType.ACCOUNT_SET
-                        ),  # noqa: mock
-                        "prelim_result": "tesSUCCESS",
-                    }
-                )
-            )
-
-        log_output = log.output[0]
-        self.assertEqual(
-            log_output,
-            "ERROR:hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange:Max retries reached. Verify transaction failed due to timeout.",
-        )
-
-        with self.assertLogs(level="ERROR") as log:
-            self.async_run_with_timeout(
-                self.connector._verify_transaction_result(
-                    {
-                        "transaction": Transaction(
-                            account="r1234", transaction_type=TransactionType.ACCOUNT_SET
-                        ),  # noqa: mock
-                        "prelim_result": "tesSUCCESS",
-                    },
-                    try_count=CONSTANTS.VERIFY_TRANSACTION_MAX_RETRY,
-                )
+        self.async_run_with_timeout(
+            self.connector._verify_transaction_result(
+                {
+                    "transaction": _UNSIGNED_ACCOUNT_SET,
+                    "prelim_result": "tesSUCCESS",
+                }
             )
-
-        log_output = log.output[0]
-        self.assertEqual(
-            log_output,
-            "ERROR:hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange:Max retries reached. Verify transaction failed due to timeout.",
         )
 
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.wait_for_final_transaction_outcome")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._make_network_check_request")
-    def test_verify_transaction_exception_none_prelim(self, network_check_mock, wait_for_outcome_mock):
-        wait_for_outcome_mock.side_effect = Exception("Test exception")
-        transaction_mock = MagicMock()
-        transaction_mock.get_hash.return_value = "hash"
-        transaction_mock.last_ledger_sequence = 12345
+        self.assertEqual([(XrplExchange.logger().name, expected_error)], self._logged_errors())
 
-        with self.assertLogs(level="ERROR") as log:
-            result, response = self.async_run_with_timeout(
-                self.connector._verify_transaction_result({"transaction": transaction_mock, "prelim_result": None})
+        self._clear_logs()
+        self.async_run_with_timeout(
+            self.connector._verify_transaction_result(
+                {
+                    "transaction": _UNSIGNED_ACCOUNT_SET,
+                    "prelim_result": "tesSUCCESS",
+                },
+                try_count=CONSTANTS.VERIFY_TRANSACTION_MAX_RETRY,
             )
-
-        log_output = log.output[0]
-        self.assertEqual(
-            log_output,
-            "ERROR:hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange:Failed to verify transaction result, prelim_result is None",
         )
 
+        self.assertEqual([(XrplExchange.logger().name, expected_error)], self._logged_errors())
+
     def test_get_order_by_sequence_order_found(self):
         # Setup
         sequence = "84437895"
-        order = InFlightOrder(
-            client_order_id="hbot",
-            exchange_order_id="84437895-88954510",
-            trading_pair=self.trading_pair,
-            order_type=OrderType.LIMIT,
-            trade_type=TradeType.BUY,
-            amount=Decimal("1.47951609"),
-            price=Decimal("0.224547537"),
-            creation_timestamp=1,
-        )
-
-        self.connector._order_tracker = MagicMock()
-        self.connector._order_tracker.all_fillable_orders = {"test_order": order}
+        self.connector._order_tracker = _TrackerStub({"test_order": self.limit_buy_order})
 
         # Action
         result = self.connector.get_order_by_sequence(sequence)
@@ -1848,16 +1679,15 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         order = InFlightOrder(
             client_order_id="test_order",
             trading_pair="XRP_USD",
-            amount=Decimal("1.47951609"),
-            price=Decimal("0.224547537"),
+            amount=_ORDER_AMOUNT,
+            price=_ORDER_PRICE,
             order_type=OrderType.LIMIT,
             trade_type=TradeType.BUY,
             exchange_order_id=None,
             creation_timestamp=1,
         )
 
-        self.connector._order_tracker = MagicMock()
-        self.connector._order_tracker.all_fillable_orders = {"test_order": order}
+        self.connector._order_tracker = _TrackerStub({"test_order": order})
 
         # Action
         result = self.connector.get_order_by_sequence("100")
@@ -1865,10 +1695,13 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         # Assert
         self.assertIsNone(result)
 
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._make_network_check_request")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._fetch_account_transactions")
-    def test_request_order_status(self, fetch_account_transactions_mock, network_check_mock, get_account_mock):
+    @patch.object(XrplExchange, "_make_network_check_request", new=_async_noop)
+    def test_request_order_status(self):
+        fetch_account_transactions_mock, get_account_mock = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._fetch_account_transactions",
+            "hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account",
+        )
+
         transactions = [
             {
                 "meta": {
@@ -1910,11 +1743,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "Flags": 131072,
                                     "Sequence": 84439852,
                                     "TakerGets": "499999",
-                                    "TakerPays": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "2.303645407683732",
-                                    },
+                                    "TakerPays": {**_SOLO_AMOUNT, "value": "2.303645407683732"},
                                 },
                             }
                         },
@@ -1925,7 +1754,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                 "NewFields": {
                                     "ExchangeRate": "4f105e50a1a8eca4",  # noqa: mock
                                     "RootIndex": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F105E50A1A8ECA4",  # noqa: mock
-                                    "TakerPaysCurrency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                    "TakerPaysCurrency": _SOLO_CURRENCY,  # noqa: mock
                                     "TakerPaysIssuer": "1EB3EAA3AD86242E1D51DC502DD6566BD39E06A6",  # noqa: mock
                                 },
                             }
@@ -1949,11 +1778,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                     "Sequence": 84439852,
                     "SigningPubKey": "ED23BA20D57103E05BA762F0A04FE50878C11BD36B7BF9ADACC3EDBD9E6D320923",  # noqa: mock
                     "TakerGets": "499999",
-                    "TakerPays": {
-                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                        "value": "2.303645407683732",
-                    },
+                    "TakerPays": {**_SOLO_AMOUNT, "value": "2.303645407683732"},
                     "TransactionType": "OfferCreate",
                     "TxnSignature": "6C6FA022E59DD9DA59E47D6736FF6DD5473A416D4A96B031D273A3DBE19E3ACA9B12A1719587CE55F19F9EA62884329A6D2C8224053517397308B59C4D39D607",  # noqa: mock
                     "date": 773184150,
@@ -1976,11 +1801,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "Flags": 131072,
                                     "Sequence": 84439853,
                                     "TakerGets": "499999",
-                                    "TakerPays": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "2.303415043142963",
-                                    },
+                                    "TakerPays": {**_SOLO_AMOUNT, "value": "2.303415043142963"},
                                 },
                             }
                         },
@@ -2018,7 +1839,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                 "NewFields": {
                                     "ExchangeRate": "4f105de55c02fe6e",  # noqa: mock
                                     "RootIndex": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F105DE55C02FE6E",  # noqa: mock
-                                    "TakerPaysCurrency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                    "TakerPaysCurrency": _SOLO_CURRENCY,  # noqa: mock
                                     "TakerPaysIssuer": "1EB3EAA3AD86242E1D51DC502DD6566BD39E06A6",  # noqa: mock
                                 },
                             }
@@ -2042,11 +1863,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                     "Sequence": 84439853,
                     "SigningPubKey": "ED23BA20D57103E05BA762F0A04FE50878C11BD36B7BF9ADACC3EDBD9E6D320923",  # noqa: mock
                     "TakerGets": "499999",
-                    "TakerPays": {
-                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                        "value": "2.303415043142963",
-                    },
+                    "TakerPays": {**_SOLO_AMOUNT, "value": "2.303415043142963"},
                     "TransactionType": "OfferCreate",
                     "TxnSignature": "9F830864D3522824F1E4349EF2FA719513F8E3D2742BDDA37DE42F8982F95571C207A4D5138CCFFE2DA14AA187570AD8FC43D74E88B01BB272B37B9CD6D77E0A",  # noqa: mock
                     "date": 773184150,
@@ -2068,11 +1885,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07B66BAB1A824D",  # noqa: mock
                                     "Flags": 131072,
                                     "Sequence": 84439854,
-                                    "TakerGets": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "2.303184724670496",
-                                    },
+                                    "TakerGets": {**_SOLO_AMOUNT, "value": "2.303184724670496"},
                                     "TakerPays": "499998",
                                 },
                             }
@@ -2089,11 +1902,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "PreviousTxnLgrSeq": 89077136,
                                     "Sequence": 84439853,
                                     "TakerGets": "499999",
-                                    "TakerPays": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "2.303415043142963",
-                                    },
+                                    "TakerPays": {**_SOLO_AMOUNT, "value": "2.303415043142963"},
                                 },
                                 "LedgerEntryType": "Offer",
                                 "LedgerIndex": "1612E220D4745CE63F6FF45821317DDFFACFCFF8A4F798A92628977A39E31C55",  # noqa: mock
@@ -2122,7 +1931,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                 "NewFields": {
                                     "ExchangeRate": "5a07b66bab1a824d",  # noqa: mock
                                     "RootIndex": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07B66BAB1A824D",  # noqa: mock
-                                    "TakerGetsCurrency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                    "TakerGetsCurrency": _SOLO_CURRENCY,  # noqa: mock
                                     "TakerGetsIssuer": "1EB3EAA3AD86242E1D51DC502DD6566BD39E06A6",  # noqa: mock
                                 },
                             }
@@ -2146,7 +1955,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "RootIndex": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F105DE55C02FE6E",  # noqa: mock
                                     "TakerGetsCurrency": "0000000000000000000000000000000000000000",  # noqa: mock
                                     "TakerGetsIssuer": "0000000000000000000000000000000000000000",  # noqa: mock
-                                    "TakerPaysCurrency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                    "TakerPaysCurrency": _SOLO_CURRENCY,  # noqa: mock
                                     "TakerPaysIssuer": "1EB3EAA3AD86242E1D51DC502DD6566BD39E06A6",  # noqa: mock
                                 },
                                 "LedgerEntryType": "DirectoryNode",
@@ -2171,11 +1980,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                     ],
                     "Sequence": 84439854,
                     "SigningPubKey": "ED23BA20D57103E05BA762F0A04FE50878C11BD36B7BF9ADACC3EDBD9E6D320923",  # noqa: mock
-                    "TakerGets": {
-                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                        "value": "2.303184724670496",
-                    },
+                    "TakerGets": {**_SOLO_AMOUNT, "value": "2.303184724670496"},
                     "TakerPays": "499998",
                     "TransactionType": "OfferCreate",
                     "TxnSignature": "0E62B49938249F9AED6C6D3C893C21569F23A84CE44F9B9189D22545D5FA05896A5F0C471C68079C8CF78682D74F114038E10DA2995C18560C2259C7590A0304",  # noqa: mock
@@ -2212,7 +2017,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                 "NewFields": {
                                     "ExchangeRate": "5a07b70349e902f1",  # noqa: mock
                                     "RootIndex": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07B70349E902F1",  # noqa: mock
-                                    "TakerGetsCurrency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                    "TakerGetsCurrency": _SOLO_CURRENCY,  # noqa: mock
                                     "TakerGetsIssuer": "1EB3EAA3AD86242E1D51DC502DD6566BD39E06A6",  # noqa: mock
                                 },
                             }
@@ -2237,11 +2042,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07B70349E902F1",  # noqa: mock
                                     "Flags": 131072,
                                     "Sequence": 84439855,
-                                    "TakerGets": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "2.302494045524753",
-                                    },
+                                    "TakerGets": {**_SOLO_AMOUNT, "value": "2.302494045524753"},
                                     "TakerPays": "499998",
                                 },
                             }
@@ -2264,11 +2065,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                     ],
                     "Sequence": 84439855,
                     "SigningPubKey": "ED23BA20D57103E05BA762F0A04FE50878C11BD36B7BF9ADACC3EDBD9E6D320923",  # noqa: mock
-                    "TakerGets": {
-                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                        "value": "2.302494045524753",
-                    },
+                    "TakerGets": {**_SOLO_AMOUNT, "value": "2.302494045524753"},
                     "TakerPays": "499998",
                     "TransactionType": "OfferCreate",
                     "TxnSignature": "505B250B923C6330CE415B6CB182767AB11A633E0D30D5FF1B3A93638AC88D5078F33E3B6D6DAE67599D02DA86494B2AD8A7A23DCA54EBE0B4928F3E86DF7E01",  # noqa: mock
@@ -2284,18 +2081,19 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         fetch_account_transactions_mock.return_value = transactions
         get_account_mock.return_value = "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK"  # noqa: mock
 
-        in_flight_order = InFlightOrder(
+        create_order = partial(
+            InFlightOrder,
             client_order_id="hbot-1719868942218900-SSOXP61c36315c76a2aa2eb3bb461924f46f4336f2",  # noqa: mock
             exchange_order_id="84439854-89077154",
             trading_pair="SOLO-XRP",
-            order_type=OrderType.LIMIT,
             trade_type=TradeType.SELL,
             price=Decimal("0.217090"),
             amount=Decimal("2.303184724670496"),
-            creation_timestamp=1719868942.0,
         )
 
-        order_update = self.async_run_with_timeout(self.connector._request_order_status(in_flight_order))
+        in_flight_order = create_order(order_type=OrderType.LIMIT, creation_timestamp=1719868942.0)
+
+        order_update = self._run(self.connector._request_order_status(in_flight_order))
 
         self.assertEqual(
             order_update.client_order_id,
@@ -2304,71 +2102,41 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(order_update.exchange_order_id, "84439854-89077154")
         self.assertEqual(order_update.new_state, OrderState.OPEN)
 
-        in_flight_order = InFlightOrder(
-            client_order_id="hbot-1719868942218900-SSOXP61c36315c76a2aa2eb3bb461924f46f4336f2",  # noqa: mock
-            exchange_order_id="84439854-89077154",
-            trading_pair="SOLO-XRP",
-            order_type=OrderType.MARKET,
-            trade_type=TradeType.SELL,
-            price=Decimal("0.217090"),
-            amount=Decimal("2.303184724670496"),
-            creation_timestamp=1719868942.0,
-        )
+        in_flight_order = create_order(order_type=OrderType.MARKET, creation_timestamp=1719868942.0)
 
-        order_update = self.async_run_with_timeout(self.connector._request_order_status(in_flight_order))
+        order_update = self._run(self.connector._request_order_status(in_flight_order))
         self.assertEqual(order_update.new_state, OrderState.FILLED)
 
         fetch_account_transactions_mock.return_value = []
 
-        order_update = self.async_run_with_timeout(self.connector._request_order_status(in_flight_order))
+        order_update = self._run(self.connector._request_order_status(in_flight_order))
         self.assertEqual(order_update.new_state, OrderState.PENDING_CREATE)
 
-        in_flight_order = InFlightOrder(
-            client_order_id="hbot-1719868942218900-SSOXP61c36315c76a2aa2eb3bb461924f46f4336f2",  # noqa: mock
-            exchange_order_id="84439854-89077154",
-            trading_pair="SOLO-XRP",
-            order_type=OrderType.LIMIT,
-            trade_type=TradeType.SELL,
-            price=Decimal("0.217090"),
-            amount=Decimal("2.303184724670496"),
-            creation_timestamp=1719868942.0,
-        )
+        in_flight_order = create_order(order_type=OrderType.LIMIT, creation_timestamp=1719868942.0)
 
-        order_update = self.async_run_with_timeout(self.connector._request_order_status(in_flight_order))
+        order_update = self._run(self.connector._request_order_status(in_flight_order))
         self.assertEqual(order_update.new_state, OrderState.FAILED)
 
-        in_flight_order = InFlightOrder(
-            client_order_id="hbot-1719868942218900-SSOXP61c36315c76a2aa2eb3bb461924f46f4336f2",  # noqa: mock
-            exchange_order_id="84439854-89077154",
-            trading_pair="SOLO-XRP",
-            order_type=OrderType.LIMIT,
-            trade_type=TradeType.SELL,
-            price=Decimal("0.217090"),
-            amount=Decimal("2.303184724670496"),
-            creation_timestamp=time.time(),
-        )
+        in_flight_order = create_order(order_type=OrderType.LIMIT, creation_timestamp=time.time())
 
-        order_update = self.async_run_with_timeout(self.connector._request_order_status(in_flight_order))
+        order_update = self._run(self.connector._request_order_status(in_flight_order))
         self.assertEqual(order_update.new_state, OrderState.PENDING_CREATE)
 
-        in_flight_order = InFlightOrder(
-            client_order_id="hbot-1719868942218900-SSOXP61c36315c76a2aa2eb3bb461924f46f4336f2",  # noqa: mock
-            trading_pair="SOLO-XRP",
-            order_type=OrderType.LIMIT,
-            trade_type=TradeType.SELL,
-            price=Decimal("0.217090"),
-            amount=Decimal("2.303184724670496"),
-            creation_timestamp=time.time(),
+        in_flight_order = create_order(
+            exchange_order_id=None, order_type=OrderType.LIMIT, creation_timestamp=time.time()
         )
 
         in_flight_order.current_state = OrderState.PENDING_CREATE
-        order_update = self.async_run_with_timeout(self.connector._request_order_status(in_flight_order))
+        order_update = self._run(self.connector._request_order_status(in_flight_order))
         self.assertEqual(order_update.new_state, OrderState.PENDING_CREATE)
 
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._make_network_check_request")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._fetch_account_transactions")
-    def test_get_trade_fills(self, fetch_account_transactions_mock, network_check_mock, get_account_mock):
+    @patch.object(XrplExchange, "_make_network_check_request", new=_async_noop)
+    def test_get_trade_fills(self):
+        fetch_account_transactions_mock, get_account_mock = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._fetch_account_transactions",
+            "hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account",
+        )
+
         transactions = [
             {
                 "meta": {
@@ -2423,7 +2191,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                 "NewFields": {
                                     "ExchangeRate": "5a07e6deeedc1281",  # noqa: mock
                                     "RootIndex": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07E6DEEEDC1281",  # noqa: mock
-                                    "TakerGetsCurrency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                    "TakerGetsCurrency": _SOLO_CURRENCY,  # noqa: mock
                                     "TakerGetsIssuer": "1EB3EAA3AD86242E1D51DC502DD6566BD39E06A6",  # noqa: mock
                                 },
                             }
@@ -2451,21 +2219,13 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "PreviousTxnLgrSeq": 88824963,
                                     "Sequence": 84436571,
                                     "TakerGets": "0",
-                                    "TakerPays": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "0",
-                                    },
+                                    "TakerPays": {**_SOLO_AMOUNT, "value": "0"},
                                 },
                                 "LedgerEntryType": "Offer",
                                 "LedgerIndex": "AFAE88AD69BC25C5DF122C38DF727F41C8F1793E2FA436382A093247BE2A3418",  # noqa: mock
                                 "PreviousFields": {
                                     "TakerGets": "1249995",
-                                    "TakerPays": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "5.619196007179491",
-                                    },
+                                    "TakerPays": {**_SOLO_AMOUNT, "value": "5.619196007179491"},
                                 },
                             }
                         },
@@ -2473,29 +2233,25 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                             "ModifiedNode": {
                                 "FinalFields": {
                                     "Balance": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
                                         "value": "-75772.00199150676",
                                     },
                                     "Flags": 2228224,
                                     "HighLimit": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "r9aZRryD8AZzGqQjYrQQuBBzebjF555Xsa",  # noqa: mock
                                         "value": "100000000",
                                     },
                                     "HighNode": "0",
-                                    "LowLimit": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "0",
-                                    },
+                                    "LowLimit": {**_SOLO_AMOUNT, "value": "0"},
                                     "LowNode": "3778",
                                 },
                                 "LedgerEntryType": "RippleState",
                                 "LedgerIndex": "BF2F4026A88BF068A5DF2ADF7A22C67193DE3E57CAE95C520EE83D02EDDADE64",  # noqa: mock
                                 "PreviousFields": {
                                     "Balance": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
                                         "value": "-75777.62174943354",
                                     }
@@ -2512,7 +2268,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "RootIndex": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F0FF88501536AF6",  # noqa: mock
                                     "TakerGetsCurrency": "0000000000000000000000000000000000000000",  # noqa: mock
                                     "TakerGetsIssuer": "0000000000000000000000000000000000000000",  # noqa: mock
-                                    "TakerPaysCurrency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                    "TakerPaysCurrency": _SOLO_CURRENCY,  # noqa: mock
                                     "TakerPaysIssuer": "1EB3EAA3AD86242E1D51DC502DD6566BD39E06A6",  # noqa: mock
                                 },
                                 "LedgerEntryType": "DirectoryNode",
@@ -2528,11 +2284,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07E6DEEEDC1281",  # noqa: mock
                                     "Flags": 131072,
                                     "Sequence": 86464580,
-                                    "TakerGets": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "1347.603946992821",
-                                    },
+                                    "TakerGets": {**_SOLO_AMOUNT, "value": "1347.603946992821"},
                                     "TakerPays": "299730027",
                                 },
                             }
@@ -2541,19 +2293,15 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                             "ModifiedNode": {
                                 "FinalFields": {
                                     "Balance": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
                                         "value": "29.36723384518376",
                                     },
                                     "Flags": 1114112,
-                                    "HighLimit": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "0",
-                                    },
+                                    "HighLimit": {**_SOLO_AMOUNT, "value": "0"},
                                     "HighNode": "3799",
                                     "LowLimit": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
                                         "value": "1000000000",
                                     },
@@ -2563,7 +2311,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                 "LedgerIndex": "E1C84325F137AD05CB78F59968054BCBFD43CB4E70F7591B6C3C1D1C7E44C6FC",  # noqa: mock
                                 "PreviousFields": {
                                     "Balance": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
                                         "value": "23.74803783800427",
                                     }
@@ -2590,11 +2338,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                     ],
                     "Sequence": 86464580,
                     "SigningPubKey": "02DFB5DD7091EC6E99A12AD016439DBBBBB8F60438D17B21B97E9F83C57106F8DB",  # noqa: mock
-                    "TakerGets": {
-                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                        "value": "1353.223143",
-                    },
+                    "TakerGets": {**_SOLO_AMOUNT, "value": "1353.223143"},
                     "TakerPays": "300979832",
                     "TransactionType": "OfferCreate",
                     "TxnSignature": "30450221009A265D011DA57D9C9A9FC3657D5DFE249DBA5D3BD5819B90D3F97E121571F51F02207ACE9130D47AF28CCE24E4D07DC58E7B51B717CA0FCB2FDBB2C9630F72642AEB",  # noqa: mock
@@ -2613,15 +2357,15 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             trading_pair="SOLO-XRP",
             order_type=OrderType.LIMIT,
             trade_type=TradeType.BUY,
-            price=Decimal("0.222451"),
-            amount=Decimal("5.619196007179491"),
+            price=_FILLED_ORDER_PRICE,
+            amount=_FILLED_ORDER_AMOUNT,
             creation_timestamp=1718906078.0,
         )
 
         fetch_account_transactions_mock.return_value = transactions
         get_account_mock.return_value = "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK"  # noqa: mock
 
-        trade_fills = self.async_run_with_timeout(self.connector._all_trade_updates_for_order(in_flight_order))
+        trade_fills = self._run(self.connector._all_trade_updates_for_order(in_flight_order))
 
         self.assertEqual(len(trade_fills), 1)
         self.assertEqual(
@@ -2699,7 +2443,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                 "NewFields": {
                                     "ExchangeRate": "5a07e6deeedc1281",  # noqa: mock
                                     "RootIndex": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07E6DEEEDC1281",  # noqa: mock
-                                    "TakerGetsCurrency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                    "TakerGetsCurrency": _SOLO_CURRENCY,  # noqa: mock
                                     "TakerGetsIssuer": "1EB3EAA3AD86242E1D51DC502DD6566BD39E06A6",  # noqa: mock
                                 },
                             }
@@ -2727,21 +2471,13 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "PreviousTxnLgrSeq": 88824963,
                                     "Sequence": 84436571,
                                     "TakerGets": "0",
-                                    "TakerPays": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "0",
-                                    },
+                                    "TakerPays": {**_SOLO_AMOUNT, "value": "0"},
                                 },
                                 "LedgerEntryType": "Offer",
                                 "LedgerIndex": "AFAE88AD69BC25C5DF122C38DF727F41C8F1793E2FA436382A093247BE2A3418",  # noqa: mock
                                 "PreviousFields": {
                                     "TakerGets": "1249995",
-                                    "TakerPays": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "5.619196007179491",
-                                    },
+                                    "TakerPays": {**_SOLO_AMOUNT, "value": "5.619196007179491"},
                                 },
                             }
                         },
@@ -2749,29 +2485,25 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                             "ModifiedNode": {
                                 "FinalFields": {
                                     "Balance": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
                                         "value": "-75772.00199150676",
                                     },
                                     "Flags": 2228224,
                                     "HighLimit": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "r9aZRryD8AZzGqQjYrQQuBBzebjF555Xsa",  # noqa: mock
                                         "value": "100000000",
                                     },
                                     "HighNode": "0",
-                                    "LowLimit": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "0",
-                                    },
+                                    "LowLimit": {**_SOLO_AMOUNT, "value": "0"},
                                     "LowNode": "3778",
                                 },
                                 "LedgerEntryType": "RippleState",
                                 "LedgerIndex": "BF2F4026A88BF068A5DF2ADF7A22C67193DE3E57CAE95C520EE83D02EDDADE64",  # noqa: mock
                                 "PreviousFields": {
                                     "Balance": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
                                         "value": "-75777.62174943354",
                                     }
@@ -2788,7 +2520,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "RootIndex": "C73FAC6C294EBA5B9E22A8237AAE80725E85372510A6CA794F0FF88501536AF6",  # noqa: mock
                                     "TakerGetsCurrency": "0000000000000000000000000000000000000000",  # noqa: mock
                                     "TakerGetsIssuer": "0000000000000000000000000000000000000000",  # noqa: mock
-                                    "TakerPaysCurrency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                    "TakerPaysCurrency": _SOLO_CURRENCY,  # noqa: mock
                                     "TakerPaysIssuer": "1EB3EAA3AD86242E1D51DC502DD6566BD39E06A6",  # noqa: mock
                                 },
                                 "LedgerEntryType": "DirectoryNode",
@@ -2804,11 +2536,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                     "BookDirectory": "5C8970D155D65DB8FF49B291D7EFFA4A09F9E8A68D9974B25A07E6DEEEDC1281",  # noqa: mock
                                     "Flags": 131072,
                                     "Sequence": 86464580,
-                                    "TakerGets": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "1347.603946992821",
-                                    },
+                                    "TakerGets": {**_SOLO_AMOUNT, "value": "1347.603946992821"},
                                     "TakerPays": "299730027",
                                 },
                             }
@@ -2817,19 +2545,15 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                             "ModifiedNode": {
                                 "FinalFields": {
                                     "Balance": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
                                         "value": "29.36723384518376",
                                     },
                                     "Flags": 1114112,
-                                    "HighLimit": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                                        "value": "0",
-                                    },
+                                    "HighLimit": {**_SOLO_AMOUNT, "value": "0"},
                                     "HighNode": "3799",
                                     "LowLimit": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK",  # noqa: mock
                                         "value": "1000000000",
                                     },
@@ -2839,7 +2563,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                                 "LedgerIndex": "E1C84325F137AD05CB78F59968054BCBFD43CB4E70F7591B6C3C1D1C7E44C6FC",  # noqa: mock
                                 "PreviousFields": {
                                     "Balance": {
-                                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
+                                        "currency": _SOLO_CURRENCY,
                                         "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",  # noqa: mock
                                         "value": "23.74803783800427",
                                     }
@@ -2866,11 +2590,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
                     ],
                     "Sequence": 84436571,
                     "SigningPubKey": "02DFB5DD7091EC6E99A12AD016439DBBBBB8F60438D17B21B97E9F83C57106F8DB",  # noqa: mock
-                    "TakerGets": {
-                        "currency": "534F4C4F00000000000000000000000000000000",  # noqa: mock
-                        "issuer": "rsoLo2S1kiGeCcn6hCUXVrCpGMWLrRrLZz",  # noqa: mock
-                        "value": "1353.223143",
-                    },
+                    "TakerGets": {**_SOLO_AMOUNT, "value": "1353.223143"},
                     "TakerPays": "300979832",
                     "TransactionType": "OfferCreate",
                     "TxnSignature": "30450221009A265D011DA57D9C9A9FC3657D5DFE249DBA5D3BD5819B90D3F97E121571F51F02207ACE9130D47AF28CCE24E4D07DC58E7B51B717CA0FCB2FDBB2C9630F72642AEB",  # noqa: mock
@@ -2891,12 +2611,12 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             trading_pair="SOLO-XRP",
             order_type=OrderType.LIMIT,
             trade_type=TradeType.BUY,
-            price=Decimal("0.222451"),
-            amount=Decimal("5.619196007179491"),
+            price=_FILLED_ORDER_PRICE,
+            amount=_FILLED_ORDER_AMOUNT,
             creation_timestamp=1718906078.0,
         )
 
-        trade_fills = self.async_run_with_timeout(self.connector._all_trade_updates_for_order(in_flight_order))
+        trade_fills = self._run(self.connector._all_trade_updates_for_order(in_flight_order))
 
         self.assertEqual(len(trade_fills), 1)
         self.assertEqual(
@@ -2913,9 +2633,11 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(trade_fills[0].fill_base_amount, Decimal("306.599028007179491"))
         self.assertEqual(trade_fills[0].fill_quote_amount, Decimal("1354.473138"))
 
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.request_with_retry")
-    def test_fetch_account_transactions(self, request_with_retry_mock, get_account_mock):
+    def test_fetch_account_transactions(self):
+        request_with_retry_mock, get_account_mock = self._patch_shared(
+            "hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.request_with_retry",
+            "hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account",
+        )
 
         get_account_mock.return_value = "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK"  # noqa: mock
         request_with_retry_mock.return_value = Response(
@@ -2939,7 +2661,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
 
         some_tx = OfferCancel(account="r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK", offer_sequence=88824981)
 
-        resp = self.async_run_with_timeout(self.connector.tx_submit(some_tx, mock_client))
+        resp = self._run(self.connector.tx_submit(some_tx, mock_client))
         self.assertEqual(resp.status, ResponseStatus.SUCCESS)
 
         # check if there is exception if response status is not success
@@ -2950,7 +2672,5 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             type=ResponseType.RESPONSE,
         )
 
-        with self.assertRaises(XRPLRequestFailureException) as context:
-            self.async_run_with_timeout(self.connector.tx_submit(some_tx, mock_client))
-
-        self.assertTrue("something" in str(context.exception))
+        with self.assertRaisesRegex(XRPLRequestFailureException, r"something"):
+            self._run(self.connector.tx_submit(some_tx, mock_client))